@@ -12,6 +12,7 @@ from pycharter import ContractMetadata, parse_contract, parse_contract_file
 
 # Get data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
+BOOK_CONTRACT = DATA_DIR / "examples" / "book_contract.yaml"
 
 
 def example_parse_from_file():
@@ -20,7 +21,7 @@ def example_parse_from_file():
     print("Example 1a: Parsing Contract from YAML File")
     print("=" * 70)
     
-    contract_path = DATA_DIR / "examples" / "book_contract.yaml"
+    contract_path = BOOK_CONTRACT
     
     # Parse the contract file
     metadata = parse_contract_file(str(contract_path))
@@ -81,7 +82,7 @@ def example_access_components():
     print("Example 1c: Accessing Decomposed Components")
     print("=" * 70)
     
-    contract_path = DATA_DIR / "examples" / "book_contract.yaml"
+    contract_path = BOOK_CONTRACT
     metadata = parse_contract_file(str(contract_path))
     
     # Access individual components
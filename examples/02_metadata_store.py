@@ -7,9 +7,17 @@ This example shows the base class interface - you'll need to subclass
 MetadataStoreClient for your specific database implementation.
 """
 
+from array import array
 from pathlib import Path
 
+import pydantic_core
+
 from pycharter import MetadataStoreClient, parse_contract_file
+from pycharter.shared import intern_schema_strings
+
+# Get data directory
+DATA_DIR = Path(__file__).parent.parent / "data"
+USER_CONTRACT = DATA_DIR / "contracts" / "user_contract.yaml"
 
 
 class ExampleMetadataStore(MetadataStoreClient):
@@ -22,8 +30,14 @@ class ExampleMetadataStore(MetadataStoreClient):
     
     def __init__(self, connection_string: str = None):
         super().__init__(connection_string)
-        # In-memory storage for demonstration
-        self._schemas = {}
+        # In-memory storage for demonstration.
+        # Schemas are stored column-wise: schema ID N lives at index N - 1.
+        self._ids = array("q")
+        self._names = []
+        self._versions = []
+        self._schema_blobs = []
+        self._schema_bytes = []  # JSON encoded once at store time
+        self._summaries = []  # name, version and property names only
         self._governance_rules = {}
         self._ownership = {}
         self._metadata = {}
@@ -41,24 +55,45 @@ class ExampleMetadataStore(MetadataStoreClient):
     
     def store_schema(self, schema_name: str, schema: dict, version: str = None):
         """Store a schema."""
-        schema_id = self._next_id
-        self._next_id += 1
-        key = f"{schema_name}:{version}" if version else schema_name
-        self._schemas[schema_id] = {
-            "id": schema_id,
+        # Share one string object per common keyword across all stored schemas
+        schema = intern_schema_strings(schema)
+        schema_id = len(self._ids) + 1
+        self._ids.append(schema_id)
+        self._names.append(schema_name)
+        self._versions.append(version)
+        self._schema_blobs.append(schema)
+        self._schema_bytes.append(pydantic_core.to_json(schema))
+        self._summaries.append({
             "name": schema_name,
             "version": version,
-            "schema": schema,
-        }
+            "props": tuple(schema.get("properties", {})),
+        })
         print(f"  ✓ Stored schema '{schema_name}' (ID: {schema_id}, Version: {version})")
         return schema_id
     
     def get_schema(self, schema_id: int):
         """Retrieve a schema."""
-        if schema_id in self._schemas:
-            return self._schemas[schema_id]["schema"]
+        if 1 <= schema_id <= len(self._schema_blobs):
+            return self._schema_blobs[schema_id - 1]
         return None
     
+    def get_schema_summary(self, schema_id: int):
+        """Retrieve a lightweight summary (name, version, property names) of a schema."""
+        if 1 <= schema_id <= len(self._summaries):
+            return self._summaries[schema_id - 1]
+        return None
+    
+    def get_schema_bytes(self, schema_id: int):
+        """Retrieve a schema as pre-serialized JSON bytes."""
+        if 1 <= schema_id <= len(self._schema_bytes):
+            return self._schema_bytes[schema_id - 1]
+        return None
+    
+    def get_by_version(self, version: str):
+        """Return the IDs of all schemas stored with the given version."""
+        ids = self._ids
+        return [ids[i] for i, v in enumerate(self._versions) if v == version]
+    
     def store_ownership(self, schema_id: int, owner: str = None, team: str = None, **kwargs):
         """Store ownership information."""
         self._ownership[schema_id] = {
@@ -80,6 +115,35 @@ class ExampleMetadataStore(MetadataStoreClient):
         }
         print(f"  ✓ Stored governance rule '{rule_name}' (ID: {rule_id})")
         return rule_id
+    
+    def store_governance_rules(self, rules: list):
+        """Store several governance rules in one batch."""
+        start = self._next_id
+        self._next_id += len(rules)
+        self._governance_rules.update(
+            (
+                start + i,
+                {"id": start + i, "name": rule_name, "rule": rule, "schema_id": schema_id},
+            )
+            for i, (rule_name, rule, schema_id) in enumerate(rules)
+        )
+        rule_ids = list(range(start, self._next_id))
+        print(f"  ✓ Stored {len(rule_ids)} governance rules in one batch")
+        return rule_ids
+    
+    def store_schema_with_ownership(
+        self,
+        schema_name: str,
+        schema: dict,
+        version: str = None,
+        owner: str = None,
+        team: str = None,
+        **kwargs,
+    ):
+        """Store a schema and its ownership together (one transaction in a real database)."""
+        schema_id = self.store_schema(schema_name, schema, version)
+        self.store_ownership(schema_id, owner=owner, team=team, **kwargs)
+        return schema_id
 
 
 def example_store_metadata():
@@ -89,39 +153,29 @@ def example_store_metadata():
     print("=" * 70)
     
     # Parse a contract
-    contract_path = Path(__file__).parent.parent / "data" / "contracts" / "user_contract.yaml"
+    contract_path = USER_CONTRACT
     metadata = parse_contract_file(str(contract_path))
     
-    # Create and connect to metadata store
-    store = ExampleMetadataStore(connection_string="example://database")
-    store.connect()
-    
-    try:
-        # Store schema
-        schema_id = store.store_schema(
+    # Create and connect to metadata store (disconnected when the block exits)
+    with ExampleMetadataStore(connection_string="example://database") as store:
+        # Store schema and ownership together
+        schema_id = store.store_schema_with_ownership(
             schema_name="user",
             schema=metadata.schema,
             version=metadata.metadata.get("version", "1.0.0"),
-        )
-        
-        # Store ownership
-        store.store_ownership(
-            schema_id=schema_id,
             owner=metadata.ownership.get("owner"),
             team=metadata.ownership.get("team"),
             contact=metadata.ownership.get("contact"),
         )
         
-        # Store governance rules
-        for rule_name, rule_data in metadata.governance_rules.items():
-            store.store_governance_rule(rule_name, rule_data, schema_id)
+        # Store all governance rules in a single batch
+        store.store_governance_rules(
+            [(name, rule, schema_id) for name, rule in metadata.governance_rules.items()]
+        )
         
         print(f"\n✓ All metadata components stored for schema ID: {schema_id}")
         
         return store, schema_id
-    
-    finally:
-        store.disconnect()
 
 
 def example_retrieve_metadata():
@@ -131,10 +185,7 @@ def example_retrieve_metadata():
     print("=" * 70)
     
     # Store some metadata first
-    store = ExampleMetadataStore()
-    store.connect()
-    
-    try:
+    with ExampleMetadataStore() as store:
         # Store a schema
         schema_id = store.store_schema(
             schema_name="product",
@@ -149,17 +200,14 @@ def example_retrieve_metadata():
             version="1.0.0",
         )
         
-        # Retrieve the schema
-        stored_schema = store.get_schema(schema_id)
+        # Retrieve the schema summary (the full schema is only needed for validation)
+        summary = store.get_schema_summary(schema_id)
         
-        if stored_schema:
-            print(f"\n✓ Retrieved schema (ID: {schema_id})")
-            print(f"  Properties: {list(stored_schema.get('properties', {}).keys())}")
+        if summary:
+            print(f"\n✓ Retrieved schema summary (ID: {schema_id})")
+            print(f"  Properties: {list(summary['props'])}")
         else:
             print(f"\n✗ Schema not found (ID: {schema_id})")
-    
-    finally:
-        store.disconnect()
 
 
 def example_custom_implementation():
@@ -172,26 +220,77 @@ def example_custom_implementation():
 To implement for your database (e.g., PostgreSQL), subclass MetadataStoreClient:
 
 ```python
-import psycopg2
+import psycopg
+import pydantic_core
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb, set_json_dumps
 from pycharter import MetadataStoreClient
 
+# Encode jsonb parameters with pydantic-core instead of the json module
+set_json_dumps(pydantic_core.to_json)
+
 class PostgreSQLMetadataStore(MetadataStoreClient):
     def connect(self):
-        self._connection = psycopg2.connect(self.connection_string)
+        self._connection = psycopg.connect(self.connection_string, row_factory=dict_row)
     
     def store_schema(self, schema_name: str, schema: dict, version: str = None):
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "INSERT INTO schemas (name, version, schema_json) VALUES (%s, %s, %s) RETURNING id",
-            (schema_name, version, json.dumps(schema))
-        )
-        return cursor.fetchone()[0]
+        # Serialize once and send the bytes as a binary parameter; prepare=True
+        # lets the server reuse the plan for repeated inserts
+        blob = pydantic_core.to_json(schema)
+        with self._connection.transaction(), self._connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO schemas (name, version, schema_json) "
+                "VALUES (%s, %s, convert_from(%b, 'UTF8')::jsonb) RETURNING id",
+                (schema_name, version, blob),
+                prepare=True,
+            )
+            return cursor.fetchone()["id"]
+    
+    def store_schemas_bulk(self, schemas: list):
+        # Stream all rows through binary COPY instead of one INSERT per schema
+        with self._connection.transaction(), self._connection.cursor() as cursor:
+            with cursor.copy(
+                "COPY schemas (name, version, schema_json) FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["text", "text", "jsonb"])
+                for schema_name, schema, version in schemas:
+                    copy.write_row((schema_name, version, Jsonb(schema)))
     
     def get_schema(self, schema_id: int):
-        cursor = self._connection.cursor()
-        cursor.execute("SELECT schema_json FROM schemas WHERE id = %s", (schema_id,))
-        result = cursor.fetchone()
-        return json.loads(result[0]) if result else None
+        # jsonb columns are decoded to dicts by the driver
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT schema_json FROM schemas WHERE id = %s", (schema_id,), prepare=True
+            )
+            result = cursor.fetchone()
+        return result["schema_json"] if result else None
+    
+    def get_schema_summary(self, schema_id: int):
+        # Served from a covering index so the schema_json column is never read:
+        #   CREATE INDEX ix_schemas_summary ON schemas (id) INCLUDE (name, version, prop_names)
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name, version, prop_names FROM schemas WHERE id = %s", (schema_id,)
+            )
+            result = cursor.fetchone()
+        if not result:
+            return None
+        return {"name": result["name"], "version": result["version"], "props": tuple(result["prop_names"])}
+    
+    def store_governance_rules(self, rules: list):
+        # executemany() runs in pipeline mode: all rows in a single round-trip
+        with self._connection.transaction(), self._connection.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO governance_rules (name, rule_json, schema_id) VALUES (%s, %s, %s) RETURNING id",
+                [(name, Jsonb(rule), schema_id) for name, rule, schema_id in rules],
+                returning=True,
+            )
+            rule_ids = []
+            while True:
+                rule_ids.append(cursor.fetchone()["id"])
+                if not cursor.nextset():
+                    break
+        return rule_ids
 ```
 
 Then use it:
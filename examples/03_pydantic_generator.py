@@ -6,13 +6,16 @@ Demonstrates how to generate Pydantic models from JSON Schema definitions.
 Supports loading from dictionaries, JSON strings, files, and URLs.
 """
 
-import json
 from pathlib import Path
 
+import pydantic_core
+
 from pycharter import from_dict, from_file, from_json, generate_model_file
 
 # Get data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
+BOOK_SCHEMA = DATA_DIR / "examples" / "book_schema.json"
+GENERATED_ORDER_MODEL = Path(__file__).parent / "generated_order_model.py"
 
 
 def example_from_dict():
@@ -57,13 +60,12 @@ def example_from_file():
     print("=" * 70)
     
     # Use the book schema from examples (which has version)
-    schema_path = DATA_DIR / "examples" / "book_schema.json"
+    schema_path = BOOK_SCHEMA
     
     if not schema_path.exists():
         print(f"\n⚠ Schema file not found: {schema_path}")
         print("  Creating example schema with version...")
         # Create a simple example schema with version
-        import json
         example_schema = {
             "type": "object",
             "version": "1.0.0",
@@ -74,15 +76,15 @@ def example_from_file():
             "required": ["name", "email"],
         }
         schema_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(schema_path, "w") as f:
-            json.dump(example_schema, f, indent=2)
+        schema_path.write_bytes(pydantic_core.to_json(example_schema, indent=2))
     
     # Generate model from file
     User = from_file(str(schema_path), "User")
     
-    # Create instance with sample data
-    user_data = {"name": "Alice", "email": "alice@example.com"}
-    user = User(**user_data)
+    # Validate a raw JSON payload directly: pydantic-core parses and validates
+    # in one pass, with no intermediate dict (prefer this over json.load + Model(**data))
+    raw = b'{"name": "Alice", "email": "alice@example.com"}'
+    user = User.model_validate_json(raw)
     
     print(f"\n✓ Generated User model from: {schema_path.name}")
     print(f"  Name: {user.name}")
@@ -139,7 +141,7 @@ def example_generate_model_file():
         "required": ["order_id", "customer_name", "total"],
     }
     
-    output_path = Path(__file__).parent / "generated_order_model.py"
+    output_path = GENERATED_ORDER_MODEL
     
     # Generate Python file with model
     generate_model_file(schema, str(output_path), "Order")
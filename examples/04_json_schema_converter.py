@@ -6,15 +6,16 @@ Demonstrates how to convert Pydantic models back to JSON Schema format.
 This enables round-trip conversion and schema documentation.
 """
 
-import json
 from pathlib import Path
 
+import pydantic_core
 from pydantic import BaseModel, Field
 
 from pycharter import to_dict, to_file, to_json
 
 # Get data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
+GENERATED_ORDER_SCHEMA = DATA_DIR / "schemas" / "generated_order_schema.json"
 
 
 def example_to_dict():
@@ -77,14 +78,13 @@ def example_to_file():
         items: list[str] = Field(default_factory=list)
     
     # Convert to file
-    output_path = DATA_DIR / "schemas" / "generated_order_schema.json"
+    output_path = GENERATED_ORDER_SCHEMA
     to_file(Order, str(output_path))
     
     print(f"\n✓ Converted Order model to file: {output_path.name}")
     
     # Verify the file
-    with open(output_path) as f:
-        saved_schema = json.load(f)
+    saved_schema = pydantic_core.from_json(output_path.read_bytes())
     
     print(f"  Saved schema has {len(saved_schema.get('properties', {}))} properties")
 
@@ -95,7 +95,7 @@ def example_round_trip():
     print("Example 4d: Round-Trip Conversion")
     print("=" * 70)
     
-    from pycharter import from_dict
+    from pycharter import from_dict, from_dict_list
     
     # Start with a schema
     original_schema = {
@@ -113,6 +113,19 @@ def example_round_trip():
     item = Item(name="Test Item", value=42.5)
     print(f"   ✓ Created model instance: {item.name} = {item.value}")
     
+    # Incoming JSON payloads are parsed and validated in one pass
+    item = Item.model_validate_json('{"name": "Parsed Item", "value": 7}')
+    print(f"   ✓ Validated JSON payload: {item.name} = {item.value}")
+    
+    # Converting the same schema again reuses the cached model class.
+    # Set PYCHARTER_SCHEMA_CACHE_DIR to also keep validated schemas across runs.
+    print(f"   ✓ Cached model reused: {from_dict(original_schema, 'Item') is Item}")
+    
+    # Validate a whole batch of rows in one pass through pydantic-core
+    rows = [{"name": f"item-{i}", "value": i} for i in range(10_000)]
+    items = from_dict_list(original_schema, "Item", rows)
+    print(f"   ✓ Validated {len(items)} rows with a single TypeAdapter call")
+    
     print("\n2. Pydantic model → JSON Schema")
     converted_schema = to_dict(Item)
     print(f"   ✓ Converted back to schema")
@@ -6,13 +6,50 @@ Demonstrates how to validate data against generated Pydantic models in
 production data pipelines, ETL scripts, and API endpoints.
 """
 
-import json
+import tempfile
+from itertools import islice
 from pathlib import Path
+from typing import Any, Dict, Iterator, Union
 
-from pycharter import ValidationResult, from_dict, from_file, validate, validate_batch
+import pydantic_core
+
+from pycharter import (
+    ValidationResult,
+    from_dict,
+    from_file,
+    try_validate,
+    validate,
+    validate_batch,
+)
 
 # Get data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
+BOOK_CONTRACT = DATA_DIR / "examples" / "book_contract.yaml"
+
+# Contract used by the dictionary-based validation example. Built once at
+# import; validate_with_contract() deep-copies the schema before merging rules.
+_EXAMPLE_CONTRACT = {
+    "schema": {
+        "type": "object",
+        "version": "1.0.0",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "age": {"type": "integer", "minimum": 0},
+        },
+        "required": ["name", "age"],
+    },
+    "coercion_rules": {
+        "rules": {"age": "coerce_to_integer"},
+    },
+}
+
+# Sample source records for the ETL example, built once at import. Validation
+# does not modify the input dicts, so they can be shared between runs.
+_RAW_USERS = (
+    {"username": "alice", "email": "alice@example.com", "age": 30},
+    {"username": "bob", "email": "bob@example.com", "age": 25},
+    {"username": "charlie", "email": "invalid-email", "age": 35},  # Invalid
+)
 
 
 def example_validate_single_record():
@@ -146,6 +183,10 @@ def example_strict_mode():
         validate(Order, invalid_data, strict=True)
     except Exception as e:
         print(f"\n✓ Strict mode: Exception raised: {type(e).__name__}")
+    
+    # Non-raising check - cheapest way to screen many mostly-invalid records
+    ok, errors = try_validate(Order, invalid_data)
+    print(f"\n✓ try_validate: ok={ok}, first error: {errors[0]['msg']}")
 
 
 def example_in_etl_pipeline():
@@ -169,11 +210,7 @@ def example_in_etl_pipeline():
     User = from_dict(schema, "User")
     
     # Simulate data from source (e.g., CSV, API, database)
-    raw_users = [
-        {"username": "alice", "email": "alice@example.com", "age": 30},
-        {"username": "bob", "email": "bob@example.com", "age": 25},
-        {"username": "charlie", "email": "invalid-email", "age": 35},  # Invalid
-    ]
+    raw_users = _RAW_USERS
     
     print("\n✓ Processing ETL pipeline with validation:")
     
@@ -255,7 +292,7 @@ def example_contract_based_validation():
         get_model_from_contract,
     )
     
-    contract_path = DATA_DIR / "examples" / "book_contract.yaml"
+    contract_path = BOOK_CONTRACT
     
     if not contract_path.exists():
         print(f"\n⚠ Contract file not found: {contract_path}")
@@ -316,27 +353,71 @@ def example_contract_based_validation():
     
     # Method 4: From dictionary
     print("\n✓ Method 4: Validate from dictionary")
-    contract_dict = {
-        "schema": {
-            "type": "object",
-            "version": "1.0.0",
-            "properties": {
-                "name": {"type": "string", "minLength": 1},
-                "age": {"type": "integer", "minimum": 0},
-            },
-            "required": ["name", "age"],
-        },
-        "coercion_rules": {
-            "rules": {"age": "coerce_to_integer"},
-        },
-    }
-    
-    result = validate_with_contract(contract_dict, {"name": "Alice", "age": "30"})
+    result = validate_with_contract(_EXAMPLE_CONTRACT, {"name": "Alice", "age": "30"})
     if result.is_valid:
         print(f"  ✓ Validation successful")
         print(f"    Name: {result.data.name}, Age: {result.data.age} (type: {type(result.data.age).__name__})")
 
 
+
+def load_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from a JSON Lines (.jsonl) or JSON array (.json) file.
+    
+    JSON Lines files are read one line at a time, so memory use stays
+    constant however large the file is. A .json file is parsed in one go.
+    """
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield pydantic_core.from_json(line)
+    else:
+        yield from pydantic_core.from_json(path.read_bytes())
+
+
+def example_streaming_from_file():
+    """Validate records streamed from a JSON Lines file in fixed-size batches."""
+    print("\n" + "=" * 70)
+    print("Example 5g: Streaming Validation from a JSON Lines File")
+    print("=" * 70)
+    
+    schema = {
+        "type": "object",
+        "version": "1.0.0",
+        "properties": {
+            "order_id": {"type": "string"},
+            "total": {"type": "number", "minimum": 0},
+        },
+        "required": ["order_id", "total"],
+    }
+    Order = from_dict(schema, "Order")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "orders.jsonl"
+        with open(path, "wb") as f:
+            for i in range(10_000):
+                record = {"order_id": f"order-{i}", "total": -1 if i % 1000 == 0 else i * 1.5}
+                f.write(pydantic_core.to_json(record) + b"\n")
+        
+        # Only one batch of records is held in memory at a time
+        records = load_records(path)
+        valid_count = invalid_count = 0
+        while True:
+            batch = list(islice(records, 1000))
+            if not batch:
+                break
+            results = validate_batch(Order, batch)
+            valid = sum(1 for r in results if r.is_valid)
+            valid_count += valid
+            invalid_count += len(results) - valid
+    
+    print(f"\n✓ Streamed {valid_count + invalid_count} records in batches of 1000")
+    print(f"  Valid: {valid_count}")
+    print(f"  Invalid: {invalid_count}")
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("PyCharter - Runtime Validator Service Examples")
@@ -349,6 +430,7 @@ if __name__ == "__main__":
     example_in_etl_pipeline()
     example_with_stored_schema()
     example_contract_based_validation()
+    example_streaming_from_file()
     
     print("\n" + "=" * 70)
     print("✓ All Runtime Validator examples completed!")
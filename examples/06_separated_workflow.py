@@ -134,10 +134,7 @@ def separated_workflow_example():
     print("Step 4: Store All Components Separately in Database")
     print("-" * 70)
     
-    store = InMemoryMetadataStore()
-    store.connect()
-    
-    try:
+    with InMemoryMetadataStore() as store:
         # Store schema (from developer)
         schema_id = store.store_schema(
             schema_name="user",
@@ -257,9 +254,6 @@ Benefits:
   - Business and developer can work independently
   - Runtime flexibility: retrieve and combine on-demand
         """)
-    
-    finally:
-        store.disconnect()
 
 
 if __name__ == "__main__":
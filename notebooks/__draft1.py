@@ -9,9 +9,13 @@ Demonstrates the core pycharter workflow:
 5. Validate data using stored components
 """
 
+from functools import cache, lru_cache
+import json
 from pathlib import Path
+from typing import Optional
 import importlib.util
 import pandas as pd
+import pydantic_core
 import yaml
 
 from pycharter import (
@@ -19,35 +23,103 @@ from pycharter import (
     PostgresMetadataStore,
     to_dict,
     to_file,
-    validate_with_store,
-    validate_batch_with_store,
+    get_model_from_store,
+    validate,
+    validate_batch,
     build_contract,
     ContractArtifacts,
 )
 
+# libyaml's C loader when available, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Setup paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
 AIRCRAFT_DIR = SCRIPT_DIR.parent / 'data' / 'examples' / 'aircraft'
 
-# Import Aircraft model
-spec = importlib.util.spec_from_file_location("aircraft_models", AIRCRAFT_DIR / 'aircraft_models.py')
-aircraft_models = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(aircraft_models)
-Aircraft = aircraft_models.Aircraft
+# CSV columns holding dates in DD-MON-YY form (e.g. "01-JAN-14")
+DATE_COLUMNS = ('VALID_SINCE', 'VALID_UNTIL', 'LAST_UPDATE')
+
+
+@cache
+def get_aircraft_model():
+    """Import the Aircraft model on first use (building it is a large part of startup)."""
+    spec = importlib.util.spec_from_file_location("aircraft_models", AIRCRAFT_DIR / 'aircraft_models.py')
+    aircraft_models = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(aircraft_models)
+    return aircraft_models.Aircraft
+
+
+@cache
+def get_df(nrows: Optional[int] = None) -> pd.DataFrame:
+    """Load the aircraft CSV on first use, optionally only its first nrows rows."""
+    # Use pyarrow's multi-threaded CSV reader for full reads when it is
+    # installed; it does not support nrows, and a short read gains nothing from it
+    if nrows is None and importlib.util.find_spec('pyarrow'):
+        df = pd.read_csv(AIRCRAFT_DIR / 'aircraft.csv', engine='pyarrow')
+    else:
+        df = pd.read_csv(AIRCRAFT_DIR / 'aircraft.csv', nrows=nrows)
+    
+    # Parse the date columns in one vectorized call per column and normalize
+    # them to ISO 8601 strings, matching the schema's date-time format
+    for col in DATE_COLUMNS:
+        df[col] = pd.to_datetime(df[col], format='%d-%b-%y', errors='coerce').dt.strftime('%Y-%m-%dT%H:%M:%S')
+    return df
+
 
-# Load data
-df = pd.read_csv(AIRCRAFT_DIR / 'aircraft.csv')
+def df_to_none_records(df: pd.DataFrame) -> list:
+    """Convert a DataFrame to a list of row dicts, with NaN/NaT replaced by None."""
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+@lru_cache(maxsize=32)
+def _get_validator(store, schema_id: str, version=None):
+    """Build the model for a stored schema once and reuse it across validations."""
+    return get_model_from_store(store, schema_id, version=version)
 
 
 def load_yaml(file_path: Path):
-    """Load YAML file."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load YAML file, reusing a JSON copy of it cached next to the file."""
+    cache_path = file_path.with_suffix('.cache.json')
+    try:
+        if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+            return pydantic_core.from_json(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    with open(file_path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    try:
+        # Stdlib json rejects non-JSON types (e.g. YAML dates) instead of
+        # converting them, so only data that round-trips exactly is cached
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except (OSError, TypeError):
+        pass
+    return data
+
+
+def load_aircraft_schema() -> dict:
+    """Return the Aircraft JSON Schema, regenerating it only when aircraft_models.py changes."""
+    models_path = AIRCRAFT_DIR / 'aircraft_models.py'
+    cache_path = AIRCRAFT_DIR / 'aircraft_models.cache.json'
+    try:
+        if cache_path.stat().st_mtime >= models_path.stat().st_mtime:
+            return pydantic_core.from_json(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    Aircraft = get_aircraft_model()
+    schema = to_dict(Aircraft)
+    to_file(Aircraft, str(AIRCRAFT_DIR / 'aircraft_schema.yaml'))
+    try:
+        cache_path.write_bytes(pydantic_core.to_json(schema))
+    except OSError:
+        pass
+    return schema
 
 
 # Step 1: Convert Pydantic model to JSON Schema
-schema = to_dict(Aircraft)
-to_file(Aircraft, str(AIRCRAFT_DIR / 'aircraft_schema.yaml'))
+schema = load_aircraft_schema()
 
 # Step 2: Load rules and metadata
 coercion_rules = load_yaml(AIRCRAFT_DIR / 'aircraft_coercion_rules.yaml')["rules"]
@@ -124,21 +196,20 @@ with open(AIRCRAFT_DIR / 'aircraft_contract.yaml', 'w', encoding='utf-8') as f:
     yaml.dump(contract, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
 # Step 4: Validate data
-sample_data = df.iloc[0].to_dict()
-sample_data = {k: (None if pd.isna(v) else v) for k, v in sample_data.items()}
-sample_data['metadata'] = {}
+# Read only the rows being validated and convert them in a single vectorized pass
+batch_data = df_to_none_records(get_df(nrows=5))
+for row in batch_data:
+    row['metadata'] = {}
+sample_data = batch_data[0]
+
+# Look up the schema and rules and build the model once, not per validation call
+model = _get_validator(store, schema_id)
 
-result = validate_with_store(store, schema_id, sample_data, strict=False)
+result = validate(model, sample_data, strict=False)
 print(f"Validation result: {'✓ Valid' if result.is_valid else '✗ Invalid'}")
 
 # Batch validation
-batch_data = []
-for i in range(min(5, len(df))):
-    row = df.iloc[i].to_dict()
-    row = {k: (None if pd.isna(v) else v) for k, v in row.items()}
-    row['metadata'] = {}
-    batch_data.append(row)
 
-batch_results = validate_batch_with_store(store, schema_id, batch_data, strict=False)
+batch_results = validate_batch(model, batch_data, strict=False)
 valid_count = sum(1 for r in batch_results if r.is_valid)
 print(f"Batch validation: {valid_count}/{len(batch_results)} valid")
@@ -12,6 +12,8 @@ Six core services:
 
 __version__ = "0.0.2"
 
+import importlib
+
 # Service 1: Contract Parser
 from pycharter.contract_parser import (
     parse_contract,
@@ -35,26 +37,13 @@ try:
 except ImportError:
     InMemoryMetadataStore = None
 
-try:
-    from pycharter.metadata_store import MongoDBMetadataStore
-except ImportError:
-    MongoDBMetadataStore = None
-
-try:
-    from pycharter.metadata_store import PostgresMetadataStore
-except ImportError:
-    PostgresMetadataStore = None
-
-try:
-    from pycharter.metadata_store import RedisMetadataStore
-except ImportError:
-    RedisMetadataStore = None
-
 # Service 3: Pydantic Generator
 from pycharter.pydantic_generator import (
     generate_model,
     generate_model_file,
+    clear_model_cache,
     from_dict,
+    from_dict_list,
     from_file,
     from_json,
     from_url,
@@ -72,6 +61,7 @@ from pycharter.json_schema_converter import (
 from pycharter.runtime_validator import (
     get_model_from_contract,
     get_model_from_store,
+    try_validate,
     validate,
     validate_batch,
     validate_batch_with_contract,
@@ -99,7 +89,9 @@ __all__ = [
     # Pydantic Generator
     "generate_model",
     "generate_model_file",
+    "clear_model_cache",
     "from_dict",
+    "from_dict_list",
     "from_file",
     "from_json",
     "from_url",
@@ -111,6 +103,7 @@ __all__ = [
     # Runtime Validator
     "validate",
     "validate_batch",
+    "try_validate",
     "ValidationResult",
     # Database-backed validation
     "validate_with_store",
@@ -121,3 +114,12 @@ __all__ = [
     "validate_batch_with_contract",
     "get_model_from_contract",
 ]
+
+
+def __getattr__(name):
+    # MongoDB/PostgreSQL/Redis stores are resolved lazily by pycharter.metadata_store
+    if name in ("MongoDBMetadataStore", "PostgresMetadataStore", "RedisMetadataStore"):
+        value = getattr(importlib.import_module("pycharter.metadata_store"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
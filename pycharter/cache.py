@@ -0,0 +1,105 @@
+"""
+Query-result caching for metadata stores.
+
+Provides a small in-process cache with LRU eviction and a per-entry
+time-to-live, used by database-backed metadata stores to avoid repeated
+round-trips for lookups that rarely change.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class QueryCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Example:
+        >>> cache = QueryCache(maxsize=2, ttl=60)
+        >>> cache.set(("schema", "1"), {"type": "object"})
+        >>> cache.get(("schema", "1"))
+        {'type': 'object'}
+        >>> cache.cache_info()["hits"]
+        1
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least recently used
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._expires: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for a key, or default on a miss or expired entry.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING and self._expires[key] > time.monotonic():
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+            if value is not _MISSING:
+                del self._data[key]
+                del self._expires[key]
+            self._misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._expires[key] = time.monotonic() + self.ttl
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                del self._expires[evicted]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value (or default if it was not cached)."""
+        with self._lock:
+            self._expires.pop(key, None)
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size, maxsize and ttl
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data and self._expires[key] > time.monotonic()
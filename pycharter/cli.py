@@ -24,16 +24,6 @@ def main():
     db_parser = subparsers.add_parser("db", help="Database management commands")
     db_subparsers = db_parser.add_subparsers(dest="db_command", help="Database command")
     
-    # Import db CLI commands
-    from pycharter.db.cli import (
-        cmd_init,
-        cmd_upgrade,
-        cmd_downgrade,
-        cmd_current,
-        cmd_history,
-        cmd_stamp,
-    )
-    
     # init
     init_parser = db_subparsers.add_parser("init", help="Initialize database schema from scratch")
     init_parser.add_argument("database_url", help="PostgreSQL connection string")
@@ -73,6 +63,17 @@ def main():
             db_parser.print_help()
             return 1
         
+        # Import db CLI commands only once a command is actually run, so that
+        # --help and usage errors don't load the database tooling
+        from pycharter.db.cli import (
+            cmd_init,
+            cmd_upgrade,
+            cmd_downgrade,
+            cmd_current,
+            cmd_history,
+            cmd_stamp,
+        )
+        
         if args.db_command == "init":
             return cmd_init(args.database_url, force=args.force)
         elif args.db_command == "upgrade":
@@ -8,12 +8,15 @@ A data contract file contains:
 - Other metadata
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import pydantic_core
 import yaml
 
+# Use the libyaml-backed parser when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ContractMetadata:
     """
@@ -27,6 +30,8 @@ class ContractMetadata:
         versions: Dictionary tracking versions of all components
     """
     
+    __slots__ = ("schema", "governance_rules", "ownership", "metadata", "versions")
+    
     def __init__(
         self,
         schema: Dict[str, Any],
@@ -167,11 +172,10 @@ def parse_contract_file(file_path: str) -> ContractMetadata:
     suffix = path.suffix.lower()
     
     if suffix in [".yaml", ".yml"]:
-        with open(path, "r", encoding="utf-8") as f:
-            contract_data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            contract_data = yaml.load(f, Loader=_YamlLoader)
     elif suffix == ".json":
-        with open(path, "r", encoding="utf-8") as f:
-            contract_data = json.load(f)
+        contract_data = pydantic_core.from_json(path.read_bytes())
     else:
         raise ValueError(
             f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml"
@@ -5,12 +5,27 @@ This module provides SQLAlchemy models and Alembic migrations for database schem
 """
 
 from pycharter.db.models.base import Base
-from pycharter.db.models.schemas import SchemaModel
-from pycharter.db.models.coercion_rules import CoercionRulesModel
-from pycharter.db.models.validation_rules import ValidationRulesModel
-from pycharter.db.models.metadata_record import MetadataModel
-from pycharter.db.models.ownership import OwnershipModel
-from pycharter.db.models.governance_rules import GovernanceRulesModel
+
+# Model classes are loaded on first access through pycharter.db.models
+_LAZY_MODELS = (
+    "SchemaModel",
+    "CoercionRulesModel",
+    "ValidationRulesModel",
+    "MetadataModel",
+    "OwnershipModel",
+    "GovernanceRulesModel",
+)
+
+
+def __getattr__(name):
+    if name not in _LAZY_MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from pycharter.db import models
+
+    model = getattr(models, name)
+    globals()[name] = model
+    return model
+
 
 __all__ = [
     "Base",
@@ -21,4 +36,3 @@ __all__ = [
     "OwnershipModel",
     "GovernanceRulesModel",
 ]
-
@@ -7,22 +7,97 @@ Following Airflow's pattern: airflow db init, airflow db upgrade
 import os
 import sys
 import argparse
-from typing import Optional
+import traceback
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-try:
-    from alembic import command
+from pycharter.config import get_database_url, set_database_url
+
+# alembic, sqlalchemy and the database models are imported inside the commands
+# that use them, so --help and argument errors don't pay for loading them
+if TYPE_CHECKING:
     from alembic.config import Config
-    from sqlalchemy import create_engine, inspect
-    from sqlalchemy.exc import OperationalError
-    ALEMBIC_AVAILABLE = True
-except ImportError:
-    ALEMBIC_AVAILABLE = False
+    from sqlalchemy.engine import Engine
 
-from pycharter.db.models.base import Base
-from pycharter.config import get_database_url, set_database_url
+# Path to alembic.ini in the project root, resolved once at import
+# pycharter/db/cli.py -> pycharter/db -> pycharter -> project root
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ALEMBIC_INI_PATH = os.path.join(_PROJECT_ROOT, "alembic.ini")
+
+# Alembic migration scripts shipped with the package
+_MIGRATIONS_VERSIONS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "migrations", "versions"
+)
+
+
+def _require_alembic() -> bool:
+    """
+    Check that alembic and sqlalchemy are installed.
+    
+    Returns:
+        True if both can be imported; otherwise prints an error and returns False
+    """
+    try:
+        import alembic  # noqa: F401
+        import sqlalchemy  # noqa: F401
+    except ImportError:
+        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+        return False
+    return True
+
+
+def _has_migrations(versions_dir: str) -> bool:
+    """
+    Check whether a migrations directory contains any migration scripts.
+    
+    Stops at the first script found instead of listing the whole directory.
+    
+    Args:
+        versions_dir: Path to the Alembic versions directory
+        
+    Returns:
+        True if the directory exists and contains a .py file
+    """
+    try:
+        with os.scandir(versions_dir) as entries:
+            return any(entry.name.endswith(".py") for entry in entries)
+    except FileNotFoundError:
+        return False
+
+
+@lru_cache(maxsize=8)
+def _get_engine(database_url: str) -> "Engine":
+    """
+    Get a SQLAlchemy engine for a database URL, creating it once per process.
+    
+    Creating an engine initializes the dialect and a connection pool, so
+    commands run in the same process share one engine per URL.
+    
+    Args:
+        database_url: Database connection string
+        
+    Returns:
+        SQLAlchemy Engine
+    """
+    from sqlalchemy import create_engine
+    
+    return create_engine(database_url, pool_pre_ping=True)
 
 
-def get_alembic_config(database_url: Optional[str] = None) -> Config:
+@lru_cache(maxsize=4)
+def _load_alembic_config(alembic_ini_path: str) -> "Config":
+    """
+    Parse alembic.ini once per path.
+    
+    The database URL is not part of the key: get_alembic_config() applies it
+    through set_database_url() on every call, and env.py reads it from there.
+    """
+    from alembic.config import Config
+    
+    return Config(alembic_ini_path)
+
+
+def get_alembic_config(database_url: Optional[str] = None) -> "Config":
     """
     Get Alembic configuration.
     
@@ -33,11 +108,7 @@ def get_alembic_config(database_url: Optional[str] = None) -> Config:
         Alembic Config object
     """
     # Get the path to alembic.ini (should be in project root)
-    # __file__ is pycharter/db/cli.py, so we need to go up 3 levels
-    current_file = os.path.abspath(__file__)
-    # pycharter/db/cli.py -> pycharter/db -> pycharter -> project root
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(current_file))))
-    alembic_ini_path = os.path.join(project_root, "alembic.ini")
+    alembic_ini_path = _ALEMBIC_INI_PATH
     
     # Alternative: try to find it relative to current working directory
     if not os.path.exists(alembic_ini_path):
@@ -53,7 +124,7 @@ def get_alembic_config(database_url: Optional[str] = None) -> Config:
                 "Make sure you're running from the project root or alembic.ini exists."
             )
     
-    config = Config(alembic_ini_path)
+    config = _load_alembic_config(alembic_ini_path)
     
     # Set database URL from argument, config, or environment variable
     if database_url:
@@ -85,8 +156,7 @@ def cmd_init(database_url: Optional[str] = None, force: bool = False) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
@@ -99,53 +169,54 @@ def cmd_init(database_url: Optional[str] = None, force: bool = False) -> int:
             print("   Or configure in pycharter.cfg or alembic.ini")
             return 1
         
-        # Set environment variable for Alembic
-        set_database_url(db_url)
+        from alembic import command
+        from alembic.script import ScriptDirectory
+        from sqlalchemy import text
         
-        # Get Alembic config
+        from pycharter.db.models import Base, _load_all
+        
+        # Get Alembic config (also sets the database URL for Alembic's env.py)
         config = get_alembic_config(db_url)
         
         # Check if database is already initialized
-        engine = create_engine(db_url)
-        inspector = inspect(engine)
+        engine = _get_engine(db_url)
         
-        # Create the pycharter schema if it doesn't exist
-        from sqlalchemy import text
-        with engine.connect() as conn:
+        # Create the pycharter schema if it doesn't exist and look up the
+        # tables init cares about, in one transaction
+        with engine.begin() as conn:
             conn.execute(text('CREATE SCHEMA IF NOT EXISTS "pycharter"'))
-            conn.commit()
+            tables = conn.execute(text(
+                "SELECT table_schema, table_name FROM information_schema.tables "
+                "WHERE table_schema IN ('pycharter', 'public') "
+                "AND table_name IN ('schemas', 'alembic_version') "
+                "AND table_type = 'BASE TABLE'"
+            )).fetchall()
         print("✓ Created 'pycharter' schema (if it didn't exist)")
         
-        # Check tables in the pycharter schema
-        existing_tables = inspector.get_table_names(schema="pycharter")
+        # Tables in the pycharter schema
+        existing_tables = {name for schema, name in tables if schema == "pycharter"}
         
         # Check if we have any migrations
-        versions_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "migrations",
-            "versions"
-        )
-        has_migrations = os.path.exists(versions_dir) and os.listdir(versions_dir)
+        has_migrations = _has_migrations(_MIGRATIONS_VERSIONS_DIR)
         
         # Check if alembic_version table exists (indicates database is versioned)
         # Note: alembic_version is typically in public schema, but we'll check both
-        public_tables = inspector.get_table_names(schema="public")
+        public_tables = {name for schema, name in tables if schema == "public"}
         has_alembic_version = "alembic_version" in public_tables or "alembic_version" in existing_tables
         has_schemas_table = "schemas" in existing_tables
         
         # Check for migration mismatch: database revision doesn't match any migration file
         if has_alembic_version and has_migrations:
-            from alembic.script import ScriptDirectory
-            
             # Get current database revision
-            # Note: alembic_version is typically in public schema (Alembic convention)
+            # Note: alembic_version is typically in public schema (Alembic convention).
+            # The table listing above says which schema has it, so query that one
+            # directly instead of letting a failed SELECT abort the transaction
+            if "alembic_version" in public_tables:
+                version_table = "public.alembic_version"
+            else:
+                version_table = '"pycharter".alembic_version'
             with engine.connect() as conn:
-                # Try public schema first (Alembic default), then pycharter schema
-                try:
-                    result = conn.execute(text("SELECT version_num FROM alembic_version"))
-                except Exception:
-                    # Try pycharter schema
-                    result = conn.execute(text('SELECT version_num FROM "pycharter".alembic_version'))
+                result = conn.execute(text(f"SELECT version_num FROM {version_table}"))
                 db_revision = result.fetchone()
                 if db_revision:
                     db_revision = db_revision[0]
@@ -195,6 +266,7 @@ def cmd_init(database_url: Optional[str] = None, force: bool = False) -> int:
         
         # Create all tables using SQLAlchemy (for initial setup)
         print("Creating database tables...")
+        _load_all()
         Base.metadata.create_all(engine)
         
         # Handle Alembic versioning
@@ -239,7 +311,6 @@ def cmd_init(database_url: Optional[str] = None, force: bool = False) -> int:
         
     except Exception as e:
         print(f"❌ Error initializing database: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -257,8 +328,7 @@ def cmd_upgrade(database_url: Optional[str] = None, revision: str = "head") -> i
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
@@ -271,12 +341,11 @@ def cmd_upgrade(database_url: Optional[str] = None, revision: str = "head") -> i
             print("   Or configure in pycharter.cfg or alembic.ini")
             return 1
         
-        if database_url:
-            set_database_url(database_url)
-        
         # Get Alembic config
         config = get_alembic_config(db_url)
         
+        from alembic import command
+        
         # Run upgrade
         print(f"Upgrading database to revision: {revision}...")
         command.upgrade(config, revision)
@@ -286,7 +355,6 @@ def cmd_upgrade(database_url: Optional[str] = None, revision: str = "head") -> i
         
     except Exception as e:
         print(f"❌ Error upgrading database: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -304,8 +372,7 @@ def cmd_downgrade(database_url: Optional[str] = None, revision: str = "-1") -> i
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
@@ -318,11 +385,10 @@ def cmd_downgrade(database_url: Optional[str] = None, revision: str = "-1") -> i
             print("   Or configure in pycharter.cfg or alembic.ini")
             return 1
         
-        if database_url:
-            set_database_url(database_url)
-        
         config = get_alembic_config(db_url)
         
+        from alembic import command
+        
         print(f"Downgrading database to revision: {revision}...")
         command.downgrade(config, revision)
         
@@ -331,7 +397,6 @@ def cmd_downgrade(database_url: Optional[str] = None, revision: str = "-1") -> i
         
     except Exception as e:
         print(f"❌ Error downgrading database: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -346,8 +411,7 @@ def cmd_current(database_url: Optional[str] = None) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
@@ -360,17 +424,12 @@ def cmd_current(database_url: Optional[str] = None) -> int:
             print("   Or configure in pycharter.cfg or alembic.ini")
             return 1
         
-        if database_url:
-            set_database_url(database_url)
-        
         config = get_alembic_config(db_url)
         
         # Get current revision
-        from alembic.script import ScriptDirectory
         from alembic.runtime.migration import MigrationContext
-        from sqlalchemy import create_engine
         
-        engine = create_engine(db_url)
+        engine = _get_engine(db_url)
         with engine.connect() as connection:
             context = MigrationContext.configure(connection)
             current_rev = context.get_current_revision()
@@ -403,8 +462,7 @@ def cmd_stamp(database_url: Optional[str] = None, revision: str = "head") -> int
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
@@ -417,11 +475,10 @@ def cmd_stamp(database_url: Optional[str] = None, revision: str = "head") -> int
             print("   Or configure in pycharter.cfg or alembic.ini")
             return 1
         
-        if database_url:
-            set_database_url(database_url)
-        
         config = get_alembic_config(db_url)
         
+        from alembic import command
+        
         # Stamp database
         print(f"Stamping database with revision: {revision}...")
         command.stamp(config, revision)
@@ -431,7 +488,6 @@ def cmd_stamp(database_url: Optional[str] = None, revision: str = "head") -> int
         
     except Exception as e:
         print(f"❌ Error stamping database: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -446,15 +502,13 @@ def cmd_history(database_url: Optional[str] = None) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    if not ALEMBIC_AVAILABLE:
-        print("❌ Error: alembic and sqlalchemy are required. Install with: pip install alembic sqlalchemy")
+    if not _require_alembic():
         return 1
     
     try:
-        if database_url:
-            set_database_url(database_url)
+        from alembic import command
         
-        config = get_alembic_config()
+        config = get_alembic_config(database_url)
         
         command.history(config)
         
@@ -16,23 +16,10 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-from pycharter.db.models.base import Base
-from pycharter.db.models import (
-    SchemaModel,
-    CoercionRulesModel,
-    ValidationRulesModel,
-    MetadataModel,
-    OwnershipModel,
-    GovernanceRulesModel,
-    SystemModel,
-    DataFeedModel,
-    BusinessOwnerModel,
-    DomainModel,
-    TeamModel,
-    DataContractModel,
-)
+from pycharter.db.models import Base, _load_all
 
 # Import all models so Alembic can detect them
+_load_all()
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
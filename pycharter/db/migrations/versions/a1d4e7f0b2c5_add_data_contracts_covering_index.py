@@ -0,0 +1,28 @@
+"""Add covering index on data contract name and version
+
+Revision ID: a1d4e7f0b2c5
+Revises: f2c6d8e3a9b1
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d4e7f0b2c5'
+down_revision: Union[str, None] = 'f2c6d8e3a9b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_data_contracts_name_ver_cover', 'data_contracts', ['name', 'version'],
+        schema='pycharter',
+        postgresql_include=['id', 'status', 'data_feed_id', 'schema_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_data_contracts_name_ver_cover', table_name='data_contracts', schema='pycharter')
@@ -0,0 +1,45 @@
+"""Use natural composite primary keys on data contract join tables
+
+Revision ID: b9e3f6a2c8d4
+Revises: a1d4e7f0b2c5
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e3f6a2c8d4'
+down_revision: Union[str, None] = 'a1d4e7f0b2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (natural key columns, unique constraint name, primary key name)
+_TABLES = {
+    'data_contract_system_links': (
+        ['data_contract_id', 'system_id', 'relation_type'], 'uq_dc_system_link', 'pk_dc_system_link'),
+    'data_contract_business_owners': (
+        ['data_contract_id', 'business_owner_id'], 'uq_dc_business_owner', 'pk_dc_business_owner'),
+    'data_contract_team_access': (
+        ['data_contract_id', 'team_id', 'permission'], 'uq_dc_team_access', 'pk_dc_team_access'),
+    'data_feed_dependencies': (
+        ['data_contract_id', 'dependency_feed_id'], 'uq_data_feed_dependency', 'pk_data_feed_dependency'),
+}
+
+
+def upgrade() -> None:
+    for table, (columns, unique_name, pk_name) in _TABLES.items():
+        op.drop_constraint(unique_name, table, schema='pycharter', type_='unique')
+        op.drop_constraint(f'{table}_pkey', table, schema='pycharter', type_='primary')
+        op.drop_column(table, 'id', schema='pycharter')
+        op.create_primary_key(pk_name, table, columns, schema='pycharter')
+
+
+def downgrade() -> None:
+    for table, (columns, unique_name, pk_name) in _TABLES.items():
+        op.drop_constraint(pk_name, table, schema='pycharter', type_='primary')
+        op.add_column(table, sa.Column('id', sa.Integer(), sa.Identity(), nullable=False), schema='pycharter')
+        op.create_primary_key(f'{table}_pkey', table, ['id'], schema='pycharter')
+        op.create_unique_constraint(unique_name, table, columns, schema='pycharter')
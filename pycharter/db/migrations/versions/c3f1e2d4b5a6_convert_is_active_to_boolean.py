@@ -0,0 +1,43 @@
+"""Convert is_active string columns to boolean
+
+Revision ID: c3f1e2d4b5a6
+Revises: a8acb1d9a1d2
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1e2d4b5a6'
+down_revision: Union[str, None] = 'a8acb1d9a1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('business_owners', 'domains', 'systems', 'teams')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table, 'is_active',
+            existing_type=sa.String(length=10),
+            type_=sa.Boolean(),
+            existing_nullable=False,
+            postgresql_using="is_active = 'true'",
+            schema='pycharter',
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table, 'is_active',
+            existing_type=sa.Boolean(),
+            type_=sa.String(length=10),
+            existing_nullable=False,
+            postgresql_using="CASE WHEN is_active THEN 'true' ELSE 'false' END",
+            schema='pycharter',
+        )
@@ -0,0 +1,46 @@
+"""Store metadata_data as jsonb with a GIN index
+
+Revision ID: c4a7d1e9f3b6
+Revises: b9e3f6a2c8d4
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7d1e9f3b6'
+down_revision: Union[str, None] = 'b9e3f6a2c8d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'metadata_record', 'metadata_data',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='metadata_data::jsonb',
+        schema='pycharter',
+    )
+    op.create_index(
+        'ix_metadata_data_gin', 'metadata_record', ['metadata_data'],
+        schema='pycharter',
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_metadata_data_gin', table_name='metadata_record', schema='pycharter')
+    op.alter_column(
+        'metadata_record', 'metadata_data',
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='metadata_data::json',
+        schema='pycharter',
+    )
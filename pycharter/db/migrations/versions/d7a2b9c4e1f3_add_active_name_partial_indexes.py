@@ -0,0 +1,33 @@
+"""Add partial indexes on active entity names
+
+Revision ID: d7a2b9c4e1f3
+Revises: c3f1e2d4b5a6
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2b9c4e1f3'
+down_revision: Union[str, None] = 'c3f1e2d4b5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('data_feeds', 'systems', 'domains', 'teams')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.create_index(
+            f'ix_{table}_active_name', table, ['name'],
+            schema='pycharter',
+            postgresql_where=sa.text('is_active = TRUE'),
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f'ix_{table}_active_name', table_name=table, schema='pycharter')
@@ -0,0 +1,44 @@
+"""Convert team access permission to an enum
+
+Revision ID: e5b8c1d2f4a7
+Revises: d7a2b9c4e1f3
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c1d2f4a7'
+down_revision: Union[str, None] = 'd7a2b9c4e1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+permission_t = postgresql.ENUM('read', 'write', name='permission_t', schema='pycharter')
+
+
+def upgrade() -> None:
+    permission_t.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'data_contract_team_access', 'permission',
+        existing_type=sa.String(length=20),
+        type_=permission_t,
+        existing_nullable=False,
+        postgresql_using='permission::pycharter.permission_t',
+        schema='pycharter',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'data_contract_team_access', 'permission',
+        existing_type=permission_t,
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using='permission::text',
+        schema='pycharter',
+    )
+    permission_t.drop(op.get_bind(), checkfirst=True)
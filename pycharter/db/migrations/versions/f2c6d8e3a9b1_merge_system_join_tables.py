@@ -0,0 +1,70 @@
+"""Merge the data contract system join tables into one
+
+Revision ID: f2c6d8e3a9b1
+Revises: e5b8c1d2f4a7
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8e3a9b1'
+down_revision: Union[str, None] = 'e5b8c1d2f4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# relation_type -> (old join table, old unique constraint)
+_OLD_TABLES = {
+    'pull': ('data_contract_system_pulls', 'uq_dc_system_pull'),
+    'push': ('data_contract_system_pushes', 'uq_dc_system_push'),
+    'source': ('data_contract_system_sources', 'uq_dc_system_source'),
+}
+
+
+def upgrade() -> None:
+    op.create_table('data_contract_system_links',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('data_contract_id', sa.Integer(), nullable=False),
+    sa.Column('system_id', sa.Integer(), nullable=False),
+    sa.Column('relation_type', sa.String(length=8), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint("relation_type IN ('pull', 'push', 'source')", name='ck_dc_system_link_relation_type'),
+    sa.ForeignKeyConstraint(['data_contract_id'], ['pycharter.data_contracts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['system_id'], ['pycharter.systems.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('data_contract_id', 'system_id', 'relation_type', name='uq_dc_system_link'),
+    schema='pycharter'
+    )
+    for relation_type, (table, _) in _OLD_TABLES.items():
+        op.execute(
+            'INSERT INTO pycharter.data_contract_system_links '
+            '(data_contract_id, system_id, relation_type, created_at) '
+            f"SELECT data_contract_id, system_id, '{relation_type}', created_at "
+            f'FROM pycharter.{table}'
+        )
+        op.drop_table(table, schema='pycharter')
+
+
+def downgrade() -> None:
+    for relation_type, (table, constraint) in _OLD_TABLES.items():
+        op.create_table(table,
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('data_contract_id', sa.Integer(), nullable=False),
+        sa.Column('system_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['data_contract_id'], ['pycharter.data_contracts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['system_id'], ['pycharter.systems.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('data_contract_id', 'system_id', name=constraint),
+        schema='pycharter'
+        )
+        op.execute(
+            f'INSERT INTO pycharter.{table} (data_contract_id, system_id, created_at) '
+            'SELECT data_contract_id, system_id, created_at '
+            'FROM pycharter.data_contract_system_links '
+            f"WHERE relation_type = '{relation_type}'"
+        )
+    op.drop_table('data_contract_system_links', schema='pycharter')
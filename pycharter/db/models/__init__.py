@@ -2,31 +2,69 @@
 SQLAlchemy Models for PyCharter Database Schema
 """
 
+import importlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
 from pycharter.db.models.base import Base
-from pycharter.db.models.schemas import SchemaModel
-from pycharter.db.models.coercion_rules import CoercionRulesModel
-from pycharter.db.models.validation_rules import ValidationRulesModel
-from pycharter.db.models.metadata_record import MetadataModel
-from pycharter.db.models.ownership import OwnershipModel
-from pycharter.db.models.governance_rules import GovernanceRulesModel
-
-# New entity models
-from pycharter.db.models.systems import SystemModel
-from pycharter.db.models.data_feeds import DataFeedModel
-from pycharter.db.models.business_owners import BusinessOwnerModel
-from pycharter.db.models.domains import DomainModel
-from pycharter.db.models.teams import TeamModel
-
-# Data contract and join tables
-from pycharter.db.models.data_contracts import (
-    DataContractModel,
-    DataContractSystemPull,
-    DataContractSystemPush,
-    DataContractSystemSource,
-    DataContractBusinessOwner,
-    DataContractTeamAccess,
-    DataFeedDependency,
-)
+
+# Model classes are imported on first access (PEP 562), so importing this
+# package only loads Base. The models refer to each other by name in their
+# relationships, so the first access loads every model module: SQLAlchemy
+# cannot configure a mapper until all of the classes it refers to are defined.
+_MODEL_CLASS_MAP = {
+    # Core component models
+    "SchemaModel": "pycharter.db.models.schemas",
+    "CoercionRulesModel": "pycharter.db.models.coercion_rules",
+    "ValidationRulesModel": "pycharter.db.models.validation_rules",
+    "MetadataModel": "pycharter.db.models.metadata_record",
+    "OwnershipModel": "pycharter.db.models.ownership",
+    "GovernanceRulesModel": "pycharter.db.models.governance_rules",
+    # Entity models
+    "SystemModel": "pycharter.db.models.systems",
+    "DataFeedModel": "pycharter.db.models.data_feeds",
+    "BusinessOwnerModel": "pycharter.db.models.business_owners",
+    "DomainModel": "pycharter.db.models.domains",
+    "TeamModel": "pycharter.db.models.teams",
+    # Data contract and join tables
+    "DataContractModel": "pycharter.db.models.data_contracts",
+    "DataContractSystemLink": "pycharter.db.models.data_contracts",
+    "DataContractBusinessOwner": "pycharter.db.models.data_contracts",
+    "DataContractTeamAccess": "pycharter.db.models.data_contracts",
+    "DataFeedDependency": "pycharter.db.models.data_contracts",
+}
+
+
+def _load_all() -> None:
+    """
+    Import every model module, registering all tables on Base.metadata.
+
+    Needed before Base.metadata.create_all() or Alembic autogenerate, which
+    only see the tables of models that have been imported.
+    """
+    for name, module_name in _MODEL_CLASS_MAP.items():
+        globals()[name] = getattr(importlib.import_module(module_name), name)
+
+
+@event.listens_for(Mapper, "before_configured")
+def _load_all_before_configure() -> None:
+    # A model module can be imported on its own (e.g. pycharter.db.models.systems);
+    # make sure the models its relationships name are defined before SQLAlchemy
+    # configures the mappers on first use
+    _load_all()
+
+
+def __getattr__(name):
+    if name not in _MODEL_CLASS_MAP:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_all()
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Base",
@@ -45,11 +83,8 @@ __all__ = [
     "TeamModel",
     # Data contract and join tables
     "DataContractModel",
-    "DataContractSystemPull",
-    "DataContractSystemPush",
-    "DataContractSystemSource",
+    "DataContractSystemLink",
     "DataContractBusinessOwner",
     "DataContractTeamAccess",
     "DataFeedDependency",
 ]
-
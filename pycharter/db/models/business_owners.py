@@ -5,7 +5,7 @@ Represents business owners or stakeholders responsible for data feeds.
 Examples: IOC, Product Team, Data Engineering
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -22,7 +22,7 @@ class BusinessOwnerModel(Base):
     description = Column(Text, nullable=True)
     contact_email = Column(String(255), nullable=True)
     department = Column(String(255), nullable=True)
-    is_active = Column(String(10), default="true", nullable=False)  # "true" or "false"
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -17,12 +17,16 @@ This is the central join table that links all components of a data contract:
 Each data contract represents a versioned contract for a specific data feed.
 """
 
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Text, Boolean, ForeignKey,
-    UniqueConstraint
+    CheckConstraint, Column, Integer, String, DateTime, Text, Boolean, Enum,
+    ForeignKey, Index, PrimaryKeyConstraint, UniqueConstraint, select
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, joinedload, raiseload, relationship, selectinload
 
 from pycharter.db.models.base import Base
 
@@ -63,87 +67,87 @@ class DataContractModel(Base):
     
     __table_args__ = (
         UniqueConstraint("name", "version", name="uq_data_contracts_name_version"),
+        # Lets (name, version) lookups of these columns be index-only scans
+        Index(
+            "ix_data_contracts_name_ver_cover", "name", "version",
+            postgresql_include=["id", "status", "data_feed_id", "schema_id"],
+        ),
         {"schema": "pycharter"},
     )
     
+    # Relationships are eager-loaded so that iterating over contracts does not
+    # issue one SELECT per contract per relationship: to-one references are
+    # joined into the contract query, and the join-table collections are
+    # loaded with one "WHERE data_contract_id IN (...)" query each
+    
     # Relationships to component tables
-    schema = relationship("SchemaModel", foreign_keys=[schema_id])
-    coercion_rules = relationship("CoercionRulesModel", foreign_keys=[coercion_rules_id])
-    validation_rules = relationship("ValidationRulesModel", foreign_keys=[validation_rules_id])
-    governance_rules = relationship("GovernanceRulesModel", foreign_keys=[governance_rules_id])
-    metadata_record = relationship("MetadataModel", foreign_keys=[metadata_id])
-    ownership = relationship("OwnershipModel", foreign_keys=[ownership_id])
+    schema = relationship("SchemaModel", foreign_keys=[schema_id], lazy="joined")
+    coercion_rules = relationship("CoercionRulesModel", foreign_keys=[coercion_rules_id], lazy="joined")
+    validation_rules = relationship("ValidationRulesModel", foreign_keys=[validation_rules_id], lazy="joined")
+    governance_rules = relationship("GovernanceRulesModel", foreign_keys=[governance_rules_id], lazy="joined")
+    metadata_record = relationship("MetadataModel", foreign_keys=[metadata_id], lazy="joined")
+    ownership = relationship("OwnershipModel", foreign_keys=[ownership_id], lazy="joined")
     
     # Relationships to entity tables
-    data_feed = relationship("DataFeedModel", back_populates="data_contracts")
-    domain = relationship("DomainModel", back_populates="data_contracts")
+    data_feed = relationship("DataFeedModel", back_populates="data_contracts", lazy="joined")
+    domain = relationship("DomainModel", back_populates="data_contracts", lazy="joined")
     
     # Relationships to join tables for many-to-many relationships
-    system_pulls = relationship("DataContractSystemPull", back_populates="data_contract", cascade="all, delete-orphan")
-    system_pushes = relationship("DataContractSystemPush", back_populates="data_contract", cascade="all, delete-orphan")
-    system_sources = relationship("DataContractSystemSource", back_populates="data_contract", cascade="all, delete-orphan")
-    business_owners = relationship("DataContractBusinessOwner", back_populates="data_contract", cascade="all, delete-orphan")
-    team_access = relationship("DataContractTeamAccess", back_populates="data_contract", cascade="all, delete-orphan")
-    feed_dependencies = relationship("DataFeedDependency", back_populates="data_contract", cascade="all, delete-orphan")
+    system_links = relationship("DataContractSystemLink", back_populates="data_contract", cascade="all, delete-orphan", lazy="selectin")
+    business_owners = relationship("DataContractBusinessOwner", back_populates="data_contract", cascade="all, delete-orphan", lazy="selectin")
+    team_access = relationship("DataContractTeamAccess", back_populates="data_contract", cascade="all, delete-orphan", lazy="selectin")
+    feed_dependencies = relationship("DataFeedDependency", back_populates="data_contract", cascade="all, delete-orphan", lazy="selectin")
+    
+    # Pulls, pushes and sources share one join table: system_links (above)
+    # loads all three with one selectin query and is the collection to write
+    # to; these read-only views filter it by relation_type in SQL
+    system_pulls = relationship(
+        "DataContractSystemLink",
+        primaryjoin="and_(DataContractModel.id == DataContractSystemLink.data_contract_id, "
+                    "DataContractSystemLink.relation_type == 'pull')",
+        viewonly=True,
+    )
+    system_pushes = relationship(
+        "DataContractSystemLink",
+        primaryjoin="and_(DataContractModel.id == DataContractSystemLink.data_contract_id, "
+                    "DataContractSystemLink.relation_type == 'push')",
+        viewonly=True,
+    )
+    system_sources = relationship(
+        "DataContractSystemLink",
+        primaryjoin="and_(DataContractModel.id == DataContractSystemLink.data_contract_id, "
+                    "DataContractSystemLink.relation_type == 'source')",
+        viewonly=True,
+    )
 
 
 # Join tables for many-to-many relationships
 
-class DataContractSystemPull(Base):
-    """Join table for data_contracts and systems (pulls_from relationship)."""
-    
-    __tablename__ = "data_contract_system_pulls"
-    
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
-    system_id = Column(Integer, ForeignKey("pycharter.systems.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
-    __table_args__ = (
-        UniqueConstraint("data_contract_id", "system_id", name="uq_dc_system_pull"),
-        {"schema": "pycharter"},
-    )
-    
-    data_contract = relationship("DataContractModel", back_populates="system_pulls")
-    system = relationship("SystemModel", back_populates="data_contracts_pull_from")
-
-
-class DataContractSystemPush(Base):
-    """Join table for data_contracts and systems (pushes_to relationship)."""
-    
-    __tablename__ = "data_contract_system_pushes"
-    
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
-    system_id = Column(Integer, ForeignKey("pycharter.systems.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+class DataContractSystemLink(Base):
+    """
+    Join table for data_contracts and systems.
     
-    __table_args__ = (
-        UniqueConstraint("data_contract_id", "system_id", name="uq_dc_system_push"),
-        {"schema": "pycharter"},
-    )
+    relation_type says how the contract uses the system: "pull" (pulls_from),
+    "push" (pushes_to) or "source" (system_sources).
+    """
     
-    data_contract = relationship("DataContractModel", back_populates="system_pushes")
-    system = relationship("SystemModel", back_populates="data_contracts_push_to")
-
-
-class DataContractSystemSource(Base):
-    """Join table for data_contracts and systems (system_sources relationship)."""
-    
-    __tablename__ = "data_contract_system_sources"
+    __tablename__ = "data_contract_system_links"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
     data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
     system_id = Column(Integer, ForeignKey("pycharter.systems.id", ondelete="CASCADE"), nullable=False)
+    relation_type = Column(String(8), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        UniqueConstraint("data_contract_id", "system_id", name="uq_dc_system_source"),
+        PrimaryKeyConstraint("data_contract_id", "system_id", "relation_type", name="pk_dc_system_link"),
+        CheckConstraint(
+            "relation_type IN ('pull', 'push', 'source')", name="ck_dc_system_link_relation_type"
+        ),
         {"schema": "pycharter"},
     )
     
-    data_contract = relationship("DataContractModel", back_populates="system_sources")
-    system = relationship("SystemModel", back_populates="data_contracts_source")
+    data_contract = relationship("DataContractModel", back_populates="system_links")
+    system = relationship("SystemModel", back_populates="data_contract_links")
 
 
 class DataContractBusinessOwner(Base):
@@ -151,13 +155,12 @@ class DataContractBusinessOwner(Base):
     
     __tablename__ = "data_contract_business_owners"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
     data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
     business_owner_id = Column(Integer, ForeignKey("pycharter.business_owners.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        UniqueConstraint("data_contract_id", "business_owner_id", name="uq_dc_business_owner"),
+        PrimaryKeyConstraint("data_contract_id", "business_owner_id", name="pk_dc_business_owner"),
         {"schema": "pycharter"},
     )
     
@@ -170,19 +173,21 @@ class DataContractTeamAccess(Base):
     
     __tablename__ = "data_contract_team_access"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
     data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
     team_id = Column(Integer, ForeignKey("pycharter.teams.id", ondelete="CASCADE"), nullable=False)
-    permission = Column(String(20), nullable=False)  # "read" or "write"
+    permission: "Column[str]" = Column(
+        Enum("read", "write", name="permission_t", schema="pycharter"),
+        nullable=False,
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        UniqueConstraint("data_contract_id", "team_id", "permission", name="uq_dc_team_access"),
+        PrimaryKeyConstraint("data_contract_id", "team_id", "permission", name="pk_dc_team_access"),
         {"schema": "pycharter"},
     )
     
     data_contract = relationship("DataContractModel", back_populates="team_access")
-    team = relationship("TeamModel", back_populates="read_permissions")
+    team = relationship("TeamModel", back_populates="access_permissions")
 
 
 class DataFeedDependency(Base):
@@ -190,17 +195,128 @@ class DataFeedDependency(Base):
     
     __tablename__ = "data_feed_dependencies"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
     data_contract_id = Column(Integer, ForeignKey("pycharter.data_contracts.id", ondelete="CASCADE"), nullable=False)
     dependency_feed_id = Column(Integer, ForeignKey("pycharter.data_feeds.id", ondelete="CASCADE"), nullable=False)
     dependency_type = Column(String(50), nullable=True)  # e.g., "required", "optional"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        UniqueConstraint("data_contract_id", "dependency_feed_id", name="uq_data_feed_dependency"),
+        PrimaryKeyConstraint("data_contract_id", "dependency_feed_id", name="pk_data_feed_dependency"),
         {"schema": "pycharter"},
     )
     
     data_contract = relationship("DataContractModel", back_populates="feed_dependencies")
     dependency_feed = relationship("DataFeedModel", foreign_keys=[dependency_feed_id])
 
+
+@lru_cache(maxsize=None)
+def contract_full_load() -> Tuple[Any, ...]:
+    """
+    Loader options that fetch a contract with every relationship.
+    
+    A contract and its to-one references come back in one joined query, plus
+    one query per join table; any other relationship raises instead of
+    lazy-loading a SELECT per row. Built on first use, because creating the
+    options configures all mappers.
+    """
+    # The relationships refer to models in sibling modules by name
+    from pycharter.db.models import _load_all
+    
+    _load_all()
+    return (
+        joinedload(DataContractModel.schema),
+        joinedload(DataContractModel.coercion_rules),
+        joinedload(DataContractModel.validation_rules),
+        joinedload(DataContractModel.governance_rules),
+        joinedload(DataContractModel.metadata_record),
+        joinedload(DataContractModel.ownership),
+        joinedload(DataContractModel.data_feed),
+        joinedload(DataContractModel.domain),
+        selectinload(DataContractModel.system_links).joinedload(DataContractSystemLink.system),
+        selectinload(DataContractModel.business_owners).joinedload(DataContractBusinessOwner.business_owner),
+        selectinload(DataContractModel.team_access).joinedload(DataContractTeamAccess.team),
+        selectinload(DataContractModel.feed_dependencies).joinedload(DataFeedDependency.dependency_feed),
+        raiseload("*"),
+    )
+
+
+def load_full_contracts(session: Session, *criteria) -> List[DataContractModel]:
+    """
+    Load data contracts with all of their relationships.
+    
+    Uses contract_full_load(), so accessing any relationship it does not cover
+    raises sqlalchemy.exc.InvalidRequestError rather than issuing a query.
+    
+    Args:
+        session: SQLAlchemy session
+        *criteria: Optional WHERE criteria, e.g. DataContractModel.name == "Aircraft"
+        
+    Returns:
+        List of DataContractModel instances
+    """
+    statement = select(DataContractModel).where(*criteria).options(*contract_full_load())
+    return list(session.scalars(statement).unique())
+
+
+@lru_cache(maxsize=None)
+def _link_insert(model: Any, constraint: str):
+    """INSERT ... ON CONFLICT DO NOTHING for a join table, built once per table."""
+    return pg_insert(model.__table__).on_conflict_do_nothing(constraint=constraint)
+
+
+def bulk_set_relationships(
+    session: Session,
+    data_contract_id: int,
+    system_pulls: Iterable[int] = (),
+    system_pushes: Iterable[int] = (),
+    system_sources: Iterable[int] = (),
+    business_owners: Iterable[int] = (),
+    team_access: Iterable[Tuple[int, str]] = (),
+    feed_dependencies: Iterable[Tuple[int, Optional[str]]] = (),
+) -> None:
+    """
+    Link a data contract to systems, owners, teams and feed dependencies in bulk.
+    
+    Each join table is written with one INSERT ... ON CONFLICT DO NOTHING
+    (PostgreSQL) executed over all of its rows, which SQLAlchemy batches into
+    multi-row VALUES, so N links cost one statement per table instead of one
+    INSERT per row, and links that already exist are left as they are. The
+    statements do not depend on the number of rows, so their compiled form
+    is reused from SQLAlchemy's statement cache on every call. The caller is
+    responsible for committing the session.
+    
+    Args:
+        session: SQLAlchemy session bound to a PostgreSQL database
+        data_contract_id: ID of the data contract to link
+        system_pulls: IDs of systems the contract pulls from
+        system_pushes: IDs of systems the contract pushes to
+        system_sources: IDs of source systems
+        business_owners: IDs of business owners
+        team_access: (team_id, permission) pairs
+        feed_dependencies: (dependency_feed_id, dependency_type) pairs
+    """
+    system_links = [
+        (system_id, relation_type)
+        for relation_type, system_ids in (
+            ("pull", system_pulls), ("push", system_pushes), ("source", system_sources)
+        )
+        for system_id in system_ids
+    ]
+    links = (
+        (DataContractSystemLink, "pk_dc_system_link", ("system_id", "relation_type"),
+         system_links),
+        (DataContractBusinessOwner, "pk_dc_business_owner", ("business_owner_id",),
+         [(owner_id,) for owner_id in business_owners]),
+        (DataContractTeamAccess, "pk_dc_team_access", ("team_id", "permission"),
+         list(team_access)),
+        (DataFeedDependency, "pk_data_feed_dependency", ("dependency_feed_id", "dependency_type"),
+         list(feed_dependencies)),
+    )
+    for model, constraint, columns, values in links:
+        if not values:
+            continue
+        rows = [
+            {"data_contract_id": data_contract_id, **dict(zip(columns, value))}
+            for value in values
+        ]
+        session.execute(_link_insert(model, constraint), rows)
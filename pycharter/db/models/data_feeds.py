@@ -5,7 +5,7 @@ Represents data feeds (datasets) that are served. Each data feed can have
 multiple data contracts (versions).
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -27,6 +27,8 @@ class DataFeedModel(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     __table_args__ = (
+        # Lookups almost always filter on active rows
+        Index("ix_data_feeds_active_name", "name", postgresql_where=text("is_active = TRUE")),
         {"schema": "pycharter"},
     )
     
@@ -5,7 +5,7 @@ Represents business domains that data feeds belong to.
 Examples: "NetlineOps configuration", "Flight Operations", "Customer Data"
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Text, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -21,15 +21,21 @@ class DomainModel(Base):
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     parent_domain_id = Column(Integer, nullable=True)  # For hierarchical domains
-    is_active = Column(String(10), default="true", nullable=False)  # "true" or "false"
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     __table_args__ = (
+        # Lookups almost always filter on active rows
+        Index("ix_domains_active_name", "name", postgresql_where=text("is_active = TRUE")),
         {"schema": "pycharter"},
     )
     
     # Relationships
     data_contracts = relationship("DataContractModel", back_populates="domain")
-    parent_domain = relationship("DomainModel", remote_side="DomainModel.id", backref="sub_domains")
+    parent_domain = relationship(
+        "DomainModel",
+        primaryjoin="foreign(DomainModel.parent_domain_id) == remote(DomainModel.id)",
+        backref="sub_domains",
+    )
 
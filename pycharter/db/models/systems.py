@@ -5,7 +5,7 @@ Represents external systems that data feeds pull from, push to, or use as source
 Examples: NetlineOpsReplica, SCR, Fleetwise, NetlineBase
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Text, UniqueConstraint, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -22,25 +22,38 @@ class SystemModel(Base):
     description = Column(Text, nullable=True)
     system_type = Column(String(50), nullable=True)  # e.g., "database", "api", "data_warehouse"
     connection_info = Column(Text, nullable=True)  # JSON string or connection details
-    is_active = Column(String(10), default="true", nullable=False)  # "true" or "false"
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     __table_args__ = (
+        # Lookups almost always filter on active rows
+        Index("ix_systems_active_name", "name", postgresql_where=text("is_active = TRUE")),
         {"schema": "pycharter"},
     )
     
     # Relationships
-    data_contracts_pull_from = relationship(
-        "DataContractSystemPull",
+    data_contract_links = relationship(
+        "DataContractSystemLink",
         back_populates="system"
     )
+    
+    # Read-only views of data_contract_links filtered by relation_type
+    data_contracts_pull_from = relationship(
+        "DataContractSystemLink",
+        primaryjoin="and_(SystemModel.id == DataContractSystemLink.system_id, "
+                    "DataContractSystemLink.relation_type == 'pull')",
+        viewonly=True,
+    )
     data_contracts_push_to = relationship(
-        "DataContractSystemPush",
-        back_populates="system"
+        "DataContractSystemLink",
+        primaryjoin="and_(SystemModel.id == DataContractSystemLink.system_id, "
+                    "DataContractSystemLink.relation_type == 'push')",
+        viewonly=True,
     )
     data_contracts_source = relationship(
-        "DataContractSystemSource",
-        back_populates="system"
+        "DataContractSystemLink",
+        primaryjoin="and_(SystemModel.id == DataContractSystemLink.system_id, "
+                    "DataContractSystemLink.relation_type == 'source')",
+        viewonly=True,
     )
-
@@ -5,7 +5,7 @@ Represents teams that have access control permissions (read/write) for data cont
 Examples: operations-team, data-team, engineering-team
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Text, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -21,11 +21,13 @@ class TeamModel(Base):
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     team_type = Column(String(50), nullable=True)  # e.g., "engineering", "operations", "data"
-    is_active = Column(String(10), default="true", nullable=False)  # "true" or "false"
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     __table_args__ = (
+        # Lookups almost always filter on active rows
+        Index("ix_teams_active_name", "name", postgresql_where=text("is_active = TRUE")),
         {"schema": "pycharter"},
     )
     
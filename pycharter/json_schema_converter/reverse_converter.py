@@ -2,16 +2,43 @@
 Reverse converter module providing a clean API for Pydantic model to JSON Schema conversion.
 """
 
-import json
+import copy
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
+import pydantic_core
 from pydantic import BaseModel
 
 from pycharter.json_schema_converter.converter import model_to_schema
 
 import yaml
 
+# Use the libyaml-backed emitter when available
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Generated schemas per model class, keyed by (title, description, version).
+# Weak keys let dynamically generated models be garbage collected.
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[type, Dict[Tuple, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
+
+def _cached_schema(
+    model: Type[BaseModel],
+    title: Optional[str],
+    description: Optional[str],
+    version: Optional[str],
+) -> Dict[str, Any]:
+    """Get the (shared, not to be mutated) JSON Schema for a model, building it once."""
+    schemas = _SCHEMA_CACHE.get(model)
+    if schemas is None:
+        schemas = _SCHEMA_CACHE.setdefault(model, {})
+    key = (title, description, version)
+    schema = schemas.get(key)
+    if schema is None:
+        schema = model_to_schema(model, title=title, description=description, version=version)
+        schemas[key] = schema
+    return schema
+
 
 def to_dict(
     model: Type[BaseModel],
@@ -22,6 +49,9 @@ def to_dict(
     """
     Convert a Pydantic model to a JSON Schema dictionary.
     
+    The schema is generated once per model (and title/description/version)
+    and cached; each call returns a copy that the caller may modify.
+    
     Args:
         model: The Pydantic model class to convert
         title: Optional title for the schema
@@ -43,7 +73,7 @@ def to_dict(
         >>> schema["properties"]["name"]["minLength"]
         3
     """
-    return model_to_schema(model, title=title, description=description, version=version)
+    return copy.deepcopy(_cached_schema(model, title, description, version))
 
 
 def to_json(
@@ -74,8 +104,8 @@ def to_json(
         >>> schema_json = to_json(User)
         >>> print(schema_json)
     """
-    schema = model_to_schema(model, title=title, description=description, version=version)
-    return json.dumps(schema, indent=indent)
+    schema = _cached_schema(model, title, description, version)
+    return pydantic_core.to_json(schema, indent=indent).decode("utf-8")
 
 
 def to_file(
@@ -109,7 +139,7 @@ def to_file(
         >>> to_file(Product, "product_schema.json")  # JSON output
         >>> to_file(Product, "product_schema.yaml")  # YAML output
     """
-    schema = model_to_schema(model, title=title, description=description, version=version)
+    schema = _cached_schema(model, title, description, version)
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -117,11 +147,19 @@ def to_file(
     suffix = path.suffix.lower()
     
     if suffix in [".yaml", ".yml"]:
-        with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(schema, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        # Emit the whole document in memory, then write it with a single call
+        data = yaml.dump(
+            schema,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+        path.write_text(data, encoding="utf-8")
     elif suffix == ".json":
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=indent)
+        # Write the encoded bytes directly, skipping the intermediate str
+        data = pydantic_core.to_json(schema, indent=indent)
+        path.write_bytes(data)
     else:
         raise ValueError(
             f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml"
@@ -11,6 +11,8 @@ Available implementations:
 - RedisMetadataStore: Redis implementation
 """
 
+import importlib
+
 from pycharter.metadata_store.client import MetadataStoreClient
 
 # Import implementations (with optional dependencies)
@@ -19,20 +21,25 @@ try:
 except ImportError:
     InMemoryMetadataStore = None
 
-try:
-    from pycharter.metadata_store.mongodb import MongoDBMetadataStore
-except ImportError:
-    MongoDBMetadataStore = None
-
-try:
-    from pycharter.metadata_store.postgres import PostgresMetadataStore
-except ImportError:
-    PostgresMetadataStore = None
-
-try:
-    from pycharter.metadata_store.redis import RedisMetadataStore
-except ImportError:
-    RedisMetadataStore = None
+# Database-backed implementations are imported on first access (PEP 562) so
+# that importing pycharter does not load their drivers unless they are used.
+_LAZY_STORES = {
+    "MongoDBMetadataStore": "pycharter.metadata_store.mongodb",
+    "PostgresMetadataStore": "pycharter.metadata_store.postgres",
+    "RedisMetadataStore": "pycharter.metadata_store.redis",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_STORES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        store_class = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        store_class = None
+    globals()[name] = store_class
+    return store_class
 
 __all__ = [
     "MetadataStoreClient",
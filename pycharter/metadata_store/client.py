@@ -8,7 +8,8 @@ Manages tables for:
 - Other metadata
 """
 
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class MetadataStoreClient:
@@ -27,7 +28,7 @@ class MetadataStoreClient:
             connection_string: Database connection string (format depends on implementation)
         """
         self.connection_string = connection_string
-        self._connection = None
+        self._connection: Any = None
     
     def connect(self) -> None:
         """
@@ -75,6 +76,28 @@ class MetadataStoreClient:
         
         raise NotImplementedError("Subclasses must implement store_schema()")
     
+    def store_schemas_bulk(
+        self,
+        schemas: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """
+        Store several schemas at once.
+        
+        The default implementation calls store_schema() for each schema.
+        Subclasses should override this to write all schemas in as few
+        round-trips as possible.
+        
+        Args:
+            schemas: List of (schema_name, schema, version) tuples
+            
+        Returns:
+            List of schema IDs, in the same order as the input schemas
+        """
+        return [
+            self.store_schema(schema_name, schema, version)
+            for schema_name, schema, version in schemas
+        ]
+    
     def get_schema(
         self, schema_id: str, version: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
@@ -93,6 +116,23 @@ class MetadataStoreClient:
         """
         raise NotImplementedError("Subclasses must implement get_schema()")
     
+    def get_schemas_bulk(self, schema_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve the latest version of several schemas at once.
+        
+        The default implementation calls get_schema() for each ID.
+        Database-backed subclasses should override this to fetch all schemas
+        in a single round-trip.
+        
+        Args:
+            schema_ids: List of schema identifiers
+            
+        Returns:
+            List of schema dictionaries (or None where not found), in the same
+            order as schema_ids
+        """
+        return [self.get_schema(schema_id) for schema_id in schema_ids]
+    
     def list_schemas(self) -> List[Dict[str, Any]]:
         """
         List all stored schemas.
@@ -121,6 +161,28 @@ class MetadataStoreClient:
         """
         raise NotImplementedError("Subclasses must implement store_governance_rule()")
     
+    def store_governance_rules(
+        self,
+        rules: List[Tuple[str, Dict[str, Any], Optional[str]]],
+    ) -> List[str]:
+        """
+        Store several governance rules at once.
+        
+        The default implementation calls store_governance_rule() for each rule.
+        Database-backed subclasses should override this to write all rules in a
+        single round-trip (e.g. a multi-row INSERT).
+        
+        Args:
+            rules: List of (rule_name, rule_definition, schema_id) tuples
+        
+        Returns:
+            List of rule IDs, in the same order as the input rules
+        """
+        return [
+            self.store_governance_rule(rule_name, rule_definition, schema_id)
+            for rule_name, rule_definition, schema_id in rules
+        ]
+    
     def get_governance_rules(
         self, schema_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -187,6 +249,28 @@ class MetadataStoreClient:
         """
         raise NotImplementedError("Subclasses must implement store_metadata()")
     
+    def store_metadata_bulk(
+        self,
+        items: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """
+        Store metadata for several resources at once.
+        
+        The default implementation calls store_metadata() for each item.
+        Database-backed subclasses should override this to write all items in
+        a single round-trip (e.g. a multi-row INSERT).
+        
+        Args:
+            items: List of (resource_id, metadata, resource_type) tuples
+            
+        Returns:
+            List of metadata record IDs, in the same order as the input items
+        """
+        return [
+            self.store_metadata(resource_id, metadata, resource_type)
+            for resource_id, metadata, resource_type in items
+        ]
+    
     def get_metadata(
         self, resource_id: str, resource_type: str = "schema"
     ) -> Optional[Dict[str, Any]]:
@@ -320,6 +404,22 @@ class MetadataStoreClient:
         
         return complete_schema
     
+    @contextmanager
+    def transaction(self) -> Iterator["MetadataStoreClient"]:
+        """
+        Group several store_* calls into a single transaction.
+        
+        The default implementation does nothing beyond yielding the client.
+        Database-backed subclasses should override this to commit once when
+        the block exits, and roll back if it raises.
+        
+        Example:
+            >>> with store.transaction():
+            ...     schema_id = store.store_schema("user", schema, "1.0.0")
+            ...     store.store_ownership(schema_id, owner="data-team")
+        """
+        yield self
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
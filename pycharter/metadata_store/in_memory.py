@@ -5,9 +5,10 @@ A simple in-memory implementation useful for testing and development.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pycharter.metadata_store.client import MetadataStoreClient
+from pycharter.shared.schema_parser import intern_schema_strings
 
 
 class InMemoryMetadataStore(MetadataStoreClient):
@@ -77,7 +78,7 @@ class InMemoryMetadataStore(MetadataStoreClient):
             "id": schema_id,
             "name": schema_name,
             "version": version,
-            "schema": schema,
+            "schema": intern_schema_strings(schema),
         }
         return schema_id
     
@@ -145,6 +146,25 @@ class InMemoryMetadataStore(MetadataStoreClient):
         }
         return rule_id
     
+    def store_governance_rules(
+        self,
+        rules: List[Tuple[str, Dict[str, Any], Optional[str]]],
+    ) -> List[str]:
+        """Store several governance rules in a single dict update."""
+        start = self._next_id
+        self._next_id += len(rules)
+        new_rules = {
+            f"rule_{start + i}": {
+                "id": f"rule_{start + i}",
+                "name": rule_name,
+                "definition": rule_definition,
+                "schema_id": schema_id,
+            }
+            for i, (rule_name, rule_definition, schema_id) in enumerate(rules)
+        }
+        self._governance_rules.update(new_rules)
+        return list(new_rules)
+    
     def get_governance_rules(
         self, schema_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -5,16 +5,17 @@ Stores metadata in MongoDB collections.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from pymongo import MongoClient
+    from pymongo import MongoClient, WriteConcern
     from pymongo.collection import Collection
     from pymongo.database import Database
     MONGO_AVAILABLE = True
 except ImportError:
     MONGO_AVAILABLE = False
     MongoClient = None
+    WriteConcern = None
     Collection = None
     Database = None
 
@@ -107,6 +108,50 @@ class MongoDBMetadataStore(MetadataStoreClient):
         if self._db is None:
             raise RuntimeError("Not connected. Call connect() first.")
         
+        doc = self._schema_document(schema_name, schema, version)
+        result = self._db.schemas.insert_one(doc)
+        return str(result.inserted_id)
+    
+    def store_schemas_bulk(
+        self,
+        schemas: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """
+        Store several schemas with a single insert_many call.
+        
+        Documents are inserted unordered with an acknowledged but unjournaled
+        write concern (w=1, j=False), trading durability on crash for ingest
+        throughput.
+        
+        Args:
+            schemas: List of (schema_name, schema, version) tuples
+            
+        Returns:
+            List of schema IDs, in the same order as the input schemas
+        """
+        if self._db is None:
+            raise RuntimeError("Not connected. Call connect() first.")
+        
+        if not schemas:
+            return []
+        
+        docs = [
+            self._schema_document(schema_name, schema, version)
+            for schema_name, schema, version in schemas
+        ]
+        collection = self._db.schemas.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+        result = collection.insert_many(docs, ordered=False)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+    
+    def _schema_document(
+        self,
+        schema_name: str,
+        schema: Dict[str, Any],
+        version: str,
+    ) -> Dict[str, Any]:
+        """Build the document stored for a schema, ensuring it is versioned."""
         # Ensure schema has version
         if "version" not in schema:
             schema = dict(schema)  # Make a copy
@@ -117,13 +162,11 @@ class MongoDBMetadataStore(MetadataStoreClient):
                 f"schema version '{schema.get('version')}'"
             )
         
-        doc = {
+        return {
             "name": schema_name,
             "version": version,
             "schema": schema,
         }
-        result = self._db.schemas.insert_one(doc)
-        return str(result.inserted_id)
     
     def get_schema(
         self, schema_id: str, version: Optional[str] = None
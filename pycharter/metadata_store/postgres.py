@@ -4,21 +4,140 @@ PostgreSQL Metadata Store Implementation
 Stores metadata in PostgreSQL tables within a dedicated schema.
 """
 
+import atexit
+import copy
+import hashlib
 import json
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
+import pydantic_core
 from alembic.runtime.migration import MigrationContext
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import (
+    RealDictCursor,
+    execute_values,
+    register_default_json,
+    register_default_jsonb,
+)
+from psycopg2.pool import PoolError, ThreadedConnectionPool  # type: ignore[import-untyped]
 from sqlalchemy import create_engine
 
+from pycharter.cache import QueryCache
 from pycharter.metadata_store.client import MetadataStoreClient
+from pycharter.shared.schema_cache import get_cache_dir
 
 try:
     from pycharter.config import get_database_url
 except ImportError:
     get_database_url = None
 
+# Connection pools shared by every store using the same connection string and
+# pool size, so connect() reuses an open (keep-alive) connection instead of a
+# new handshake
+_POOLS: Dict[Tuple[str, int], ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(connection_string: str, maxconn: int) -> ThreadedConnectionPool:
+    """Get or create the shared connection pool for a connection string and size."""
+    key = (connection_string, maxconn)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool.closed:
+            pool = ThreadedConnectionPool(
+                1, maxconn, connection_string, keepalives=1, keepalives_idle=30
+            )
+            _POOLS[key] = pool
+        return pool
+
+
+# Names of server-side prepared statements, tracked per connection because
+# PREPARE only lasts for the session that issued it
+_PREPARED: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+
+# Connections whose json/jsonb typecasters have been replaced, so every
+# JSON column is decoded once by pydantic-core when the row is fetched
+_JSON_DECODERS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _register_json_decoders(connection) -> None:
+    """Decode json and jsonb columns on this connection with pydantic-core."""
+    if connection in _JSON_DECODERS:
+        return
+    register_default_json(connection, loads=pydantic_core.from_json)
+    register_default_jsonb(connection, loads=pydantic_core.from_json)
+    _JSON_DECODERS.add(connection)
+
+
+# get_schema_info() results keyed on a hash of (connection string, schema name).
+# Entries younger than SCHEMA_INFO_TTL are served as-is; older ones are served
+# stale while a background thread refreshes them.
+SCHEMA_INFO_TTL = 60.0
+_SCHEMA_INFO: Dict[str, Dict[str, Any]] = {}
+_SCHEMA_INFO_LOCK = threading.Lock()
+
+
+def _schema_info_path() -> Optional[str]:
+    """Get the on-disk schema info cache file, or None if caching is disabled."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    return str(cache_dir / "schema_info.json")
+
+
+def _read_schema_info(key: str) -> Optional[Dict[str, Any]]:
+    """Get a cached schema info entry ({"timestamp", "info"}), or None."""
+    with _SCHEMA_INFO_LOCK:
+        entry = _SCHEMA_INFO.get(key)
+        if entry is not None:
+            return entry
+        path = _schema_info_path()
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _SCHEMA_INFO.update(json.load(f))
+        except (OSError, ValueError):
+            return None
+        return _SCHEMA_INFO.get(key)
+
+
+def _write_schema_info(key: str, info: Dict[str, Any]) -> None:
+    """Cache a schema info result, persisting it if a cache directory is set."""
+    with _SCHEMA_INFO_LOCK:
+        _SCHEMA_INFO[key] = {"timestamp": time.time(), "info": info}
+        path = _schema_info_path()
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_SCHEMA_INFO, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Close all shared connection pools."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            if not pool.closed:
+                pool.closeall()
+        _POOLS.clear()
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSONB payload with pydantic-core's Rust encoder."""
+    return pydantic_core.to_json(value).decode("utf-8")
+
 
 class PostgresMetadataStore(MetadataStoreClient):
     """
@@ -56,7 +175,12 @@ class PostgresMetadataStore(MetadataStoreClient):
         ... )
     """
     
-    def __init__(self, connection_string: Optional[str] = None, schema_name: str = "pycharter"):
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        schema_name: str = "pycharter",
+        pool_size: int = 10,
+    ):
         """
         Initialize PostgreSQL metadata store.
         
@@ -68,6 +192,9 @@ class PostgresMetadataStore(MetadataStoreClient):
                               - pycharter.cfg config file
                               - alembic.ini config file
             schema_name: PostgreSQL schema name to use (default: "pycharter")
+            pool_size: Maximum number of connections in the shared pool for
+                       this connection string; stores with the same connection
+                       string and pool_size share one pool (default: 10)
         """
         # Try to get connection string from config if not provided
         if not connection_string and get_database_url:
@@ -83,7 +210,20 @@ class PostgresMetadataStore(MetadataStoreClient):
         
         super().__init__(connection_string)
         self.schema_name = schema_name
+        self.pool_size = pool_size
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pooled = False
         self._connection = None
+        # Set inside transaction(): store_* calls leave committing to it
+        self._in_transaction = False
+        # Cache of get_schema() results keyed on (schema_id, version), and of
+        # get_ownership()/get_metadata() results keyed on ("ownership", resource_id)
+        # and ("metadata", resource_id, resource_type)
+        self._query_cache = QueryCache(maxsize=10_000, ttl=60)
+        self._schema_info_key = hashlib.blake2b(
+            f"{connection_string}\0{schema_name}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        self._refresh_thread: Optional[threading.Thread] = None
     
     def connect(self, validate_schema_on_connect: bool = True) -> None:
         """
@@ -103,11 +243,23 @@ class PostgresMetadataStore(MetadataStoreClient):
         if not self.connection_string:
             raise ValueError("connection_string is required for PostgreSQL")
         
-        self._connection = psycopg2.connect(self.connection_string)
+        # Check out a connection from the shared pool (opened on first use)
+        self._pool = _get_pool(self.connection_string, self.pool_size)
+        try:
+            self._connection = self._pool.getconn()
+            if self._connection.closed:
+                self._pool.putconn(self._connection, close=True)
+                self._connection = self._pool.getconn()
+            self._pooled = True
+        except PoolError:
+            # Pool exhausted: fall back to a dedicated connection
+            self._connection = psycopg2.connect(self.connection_string)
+            self._pooled = False
+        _register_json_decoders(self._connection)
         self._ensure_schema_exists()
         self._set_search_path()
         
-        if validate_schema_on_connect and not self._is_schema_initialized():
+        if validate_schema_on_connect and not self._schema_initialized():
             raise RuntimeError(
                 "Database schema is not initialized. "
                 "Please run 'pycharter db init' to initialize the schema first.\n"
@@ -115,9 +267,12 @@ class PostgresMetadataStore(MetadataStoreClient):
             )
     
     def disconnect(self) -> None:
-        """Close PostgreSQL connection."""
+        """Return the PostgreSQL connection to the shared pool."""
         if self._connection:
-            self._connection.close()
+            if self._pooled and self._pool is not None and not self._pool.closed:
+                self._pool.putconn(self._connection)
+            else:
+                self._connection.close()
             self._connection = None
     
     # Connection management helpers
@@ -143,49 +298,154 @@ class PostgresMetadataStore(MetadataStoreClient):
             return False
         
         try:
-            with self._connection.cursor() as cur:
-                cur.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = %s AND table_name = 'schemas'
-                    )
-                """, (self.schema_name,))
-                return cur.fetchone()[0]
+            return self._query_schema_initialized(self._connection)
         except Exception:
             return False
     
+    def _query_schema_initialized(self, connection) -> bool:
+        """Query information_schema for the schemas table; errors propagate."""
+        with connection.cursor() as cur:
+            cur.execute("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables 
+                    WHERE table_schema = %s AND table_name = 'schemas'
+                )
+            """, (self.schema_name,))
+            return cur.fetchone()[0]
+    
+    def _schema_initialized(self) -> bool:
+        """
+        Check if the schema is initialized, trusting a cached positive result.
+        
+        A recent get_schema_info() that saw the schema initialized lets connect()
+        skip the information_schema query.
+        """
+        entry = _read_schema_info(self._schema_info_key)
+        if entry is not None and entry["info"].get("initialized"):
+            if time.time() - entry["timestamp"] >= SCHEMA_INFO_TTL:
+                self._schedule_schema_info_refresh()
+            return True
+        return self._is_schema_initialized()
+    
     def _require_connection(self) -> None:
         """Raise error if not connected."""
         if not self._connection:
             raise RuntimeError("Not connected. Call connect() first.")
     
     def _parse_jsonb(self, value: Any) -> Dict[str, Any]:
-        """Parse JSONB value (psycopg2 may return dict or str)."""
-        if isinstance(value, str):
-            return json.loads(value)
+        """Return a decoded JSON column value, or {} for NULL."""
         return value if value is not None else {}
     
+    def _commit(self) -> None:
+        """Commit the current write, unless it is part of transaction()."""
+        if not self._in_transaction:
+            self._connection.commit()
+    
+    @contextmanager
+    def transaction(self) -> Iterator["PostgresMetadataStore"]:
+        """
+        Commit all store_* calls made inside the block once, on exit.
+        
+        Each store_* call otherwise commits (and waits for the WAL flush) on
+        its own. If the block raises, every write in it is rolled back and
+        the query cache is cleared, since reads inside the block may have
+        cached uncommitted rows. Nested calls join the outer transaction.
+        
+        Example:
+            >>> with store.transaction():
+            ...     schema_id = store.store_schema("user", schema, "1.0.0")
+            ...     store.store_metadata(schema_id, {"domain": "crm"}, "schema")
+        """
+        self._require_connection()
+        if self._in_transaction:
+            yield self
+            return
+        
+        self._in_transaction = True
+        try:
+            yield self
+            self._connection.commit()
+        except BaseException:
+            self._connection.rollback()
+            self._query_cache.clear()
+            raise
+        finally:
+            self._in_transaction = False
+    
     def _table_name(self, table: str) -> str:
         """Get fully qualified table name."""
         return f'"{self.schema_name}".{table}'
     
+    def _execute_prepared(self, cur, name: str, sql: str, params: Tuple) -> None:
+        """
+        Execute a statement through a server-side prepared statement.
+        
+        The statement is prepared the first time it is used on the current
+        connection, so later calls skip parsing and planning on the server.
+        
+        Args:
+            cur: Cursor to execute on
+            name: Statement name (unique per schema_name)
+            sql: Statement text using $1, $2, ... placeholders
+            params: Parameter values
+        """
+        statement = f'"{self.schema_name}.{name}"'
+        prepared = _PREPARED.setdefault(self._connection, set())
+        if statement not in prepared:
+            cur.execute(f"PREPARE {statement} AS {sql}")
+            prepared.add(statement)
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cur.execute(f"EXECUTE {statement} ({placeholders})", params)
+        else:
+            cur.execute(f"EXECUTE {statement}")
+    
     # Schema info
     
     def get_schema_info(self) -> Dict[str, Any]:
         """
         Get information about the current database schema.
         
+        Results are cached per connection string and schema name (and persisted
+        to PYCHARTER_SCHEMA_CACHE_DIR when set). A cached result younger than
+        SCHEMA_INFO_TTL seconds is returned without querying the database; an
+        older one is returned immediately while a background thread refreshes it.
+        
         Returns:
             Dictionary with schema information:
             {
                 "revision": str or None,
                 "initialized": bool,
-                "message": str
+                "message": str,
+                "cache": dict (query cache statistics)
             }
         """
         self._require_connection()
         
-        initialized = self._is_schema_initialized()
+        entry = _read_schema_info(self._schema_info_key)
+        if entry is None:
+            info = self._fetch_schema_info()
+            _write_schema_info(self._schema_info_key, info)
+        else:
+            info = entry["info"]
+            if time.time() - entry["timestamp"] >= SCHEMA_INFO_TTL:
+                self._schedule_schema_info_refresh()
+        
+        return {**info, "cache": self._query_cache.cache_info()}
+    
+    def _fetch_schema_info(self, connection=None) -> Dict[str, Any]:
+        """
+        Query the database for schema initialization state and revision.
+        
+        Args:
+            connection: Connection to query on. If given, query errors
+                        propagate; otherwise the store's connection is used and
+                        errors are reported as an uninitialized schema.
+        """
+        if connection is None:
+            initialized = self._is_schema_initialized()
+        else:
+            initialized = self._query_schema_initialized(connection)
         revision = None
         
         if initialized:
@@ -195,14 +455,49 @@ class PostgresMetadataStore(MetadataStoreClient):
                     context = MigrationContext.configure(conn)
                     revision = context.get_current_revision()
             except Exception:
-                pass
+                if connection is not None:
+                    raise
         
         return {
             "revision": revision,
             "initialized": initialized,
-            "message": f"Schema initialized: {initialized}" + (f" (revision: {revision})" if revision else "")
+            "message": f"Schema initialized: {initialized}" + (f" (revision: {revision})" if revision else ""),
         }
     
+    def _schedule_schema_info_refresh(self) -> None:
+        """Refresh the cached schema info in a background thread."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_schema_info, daemon=True
+        )
+        self._refresh_thread.start()
+    
+    def _refresh_schema_info(self) -> None:
+        """
+        Re-query schema info; on failure the stale entry keeps being served.
+        
+        Runs on its own pooled connection, so it never issues queries inside
+        a transaction open on the store's connection.
+        """
+        pool = self._pool
+        if pool is None or pool.closed:
+            return
+        try:
+            connection = pool.getconn()
+        except Exception:
+            return
+        try:
+            info = self._fetch_schema_info(connection)
+        except Exception:
+            return
+        finally:
+            if pool.closed:
+                connection.close()
+            else:
+                pool.putconn(connection)
+        _write_schema_info(self._schema_info_key, info)
+    
     # Schema operations
     
     def store_schema(
@@ -227,6 +522,81 @@ class PostgresMetadataStore(MetadataStoreClient):
         """
         self._require_connection()
         
+        schema = self._versioned_schema(schema, version)
+        
+        with self._connection.cursor() as cur:
+            self._execute_prepared(cur, "store_schema", f"""
+                INSERT INTO {self._table_name("schemas")} (name, version, schema_data)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (name, version) 
+                DO UPDATE SET schema_data = EXCLUDED.schema_data
+                RETURNING id
+            """, (schema_name, version, _json_dumps(schema)))
+            
+            schema_id = cur.fetchone()[0]
+            self._commit()
+        
+        self._query_cache.pop((str(schema_id), None))
+        self._query_cache.pop((str(schema_id), version))
+        return str(schema_id)
+    
+    def store_schemas_bulk(
+        self,
+        schemas: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """
+        Store several schemas with one multi-row INSERT in a single transaction.
+        
+        Schemas that already exist (same name and version) are updated, as in
+        store_schema(). If the same name and version appear more than once,
+        the last one wins.
+        
+        Args:
+            schemas: List of (schema_name, schema, version) tuples
+            
+        Returns:
+            List of schema IDs, in the same order as the input schemas
+            
+        Raises:
+            ValueError: If a schema's version doesn't match its provided version
+        """
+        self._require_connection()
+        
+        if not schemas:
+            return []
+        
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+        # statement, so collapse duplicate (name, version) pairs first
+        rows: Dict[Tuple[str, str], str] = {}
+        for schema_name, schema, version in schemas:
+            schema = self._versioned_schema(schema, version)
+            rows[(schema_name, version)] = _json_dumps(schema)
+        
+        with self._connection.cursor() as cur:
+            result = execute_values(
+                cur,
+                f"""
+                INSERT INTO {self._table_name("schemas")} (name, version, schema_data)
+                VALUES %s
+                ON CONFLICT (name, version)
+                DO UPDATE SET schema_data = EXCLUDED.schema_data
+                RETURNING id, name, version
+                """,
+                [(name, version, data) for (name, version), data in rows.items()],
+                page_size=500,
+                fetch=True,
+            )
+            self._commit()
+        
+        ids = {(name, version): str(schema_id) for schema_id, name, version in result}
+        for (name, version), schema_id in ids.items():
+            self._query_cache.pop((schema_id, None))
+            self._query_cache.pop((schema_id, version))
+        return [ids[(schema_name, version)] for schema_name, _, version in schemas]
+    
+    @staticmethod
+    def _versioned_schema(schema: Dict[str, Any], version: str) -> Dict[str, Any]:
+        """Return the schema with its version set, checking it matches the given one."""
         # Ensure schema has version
         if "version" not in schema:
             schema = dict(schema)
@@ -236,19 +606,7 @@ class PostgresMetadataStore(MetadataStoreClient):
                 f"Version mismatch: provided version '{version}' does not match "
                 f"schema version '{schema.get('version')}'"
             )
-        
-        with self._connection.cursor() as cur:
-            cur.execute(f"""
-                INSERT INTO {self._table_name("schemas")} (name, version, schema_data)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (name, version) 
-                DO UPDATE SET schema_data = EXCLUDED.schema_data
-                RETURNING id
-            """, (schema_name, version, json.dumps(schema)))
-            
-            schema_id = cur.fetchone()[0]
-            self._connection.commit()
-            return str(schema_id)
+        return schema
     
     def get_schema(
         self, schema_id: str, version: Optional[str] = None
@@ -262,20 +620,31 @@ class PostgresMetadataStore(MetadataStoreClient):
             
         Returns:
             Schema dictionary with version included, or None if not found
+        
+        Results are cached for 60 seconds; storing a schema invalidates its entry.
         """
         self._require_connection()
         
+        cache_key = (str(schema_id), version)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
             if version:
-                cur.execute(
+                self._execute_prepared(
+                    cur,
+                    "get_schema_version",
                     f'SELECT schema_data, version FROM {self._table_name("schemas")} '
-                    'WHERE id = %s AND version = %s',
+                    'WHERE id = $1 AND version = $2',
                     (schema_id, version),
                 )
             else:
-                cur.execute(
+                self._execute_prepared(
+                    cur,
+                    "get_schema_latest",
                     f'SELECT schema_data, version FROM {self._table_name("schemas")} '
-                    'WHERE id = %s ORDER BY version DESC LIMIT 1',
+                    'WHERE id = $1 ORDER BY version DESC LIMIT 1',
                     (schema_id,),
                 )
             
@@ -290,17 +659,73 @@ class PostgresMetadataStore(MetadataStoreClient):
             if "version" not in schema_data:
                 schema_data = dict(schema_data)
                 schema_data["version"] = stored_version or "1.0.0"
+        
+        self._query_cache.set(cache_key, schema_data)
+        return copy.deepcopy(schema_data)
+    
+    def get_schemas_bulk(self, schema_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve several schemas with one query.
+        
+        Cached schemas are served from the query cache; the rest are fetched
+        together with "WHERE id = ANY(...)", so N schemas cost one round-trip
+        instead of N.
+        
+        Args:
+            schema_ids: List of schema identifiers
             
-            return schema_data
+        Returns:
+            List of schema dictionaries (or None where not found), in the same
+            order as schema_ids
+        """
+        self._require_connection()
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = set()
+        for schema_id in schema_ids:
+            cached = self._query_cache.get((str(schema_id), None))
+            if cached is not None:
+                found[str(schema_id)] = cached
+            else:
+                try:
+                    missing.add(int(schema_id))
+                except (TypeError, ValueError):
+                    # Not a valid schema ID, so it cannot exist: left as None
+                    pass
+        
+        if missing:
+            with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
+                self._execute_prepared(
+                    cur,
+                    "get_schemas_bulk",
+                    f'SELECT id, schema_data, version FROM {self._table_name("schemas")} '
+                    'WHERE id = ANY($1::int[])',
+                    (sorted(missing),),
+                )
+                for row in cur.fetchall():
+                    schema_data = self._parse_jsonb(row["schema_data"])
+                    if "version" not in schema_data:
+                        schema_data = dict(schema_data)
+                        schema_data["version"] = row.get("version") or "1.0.0"
+                    found[str(row["id"])] = schema_data
+                    self._query_cache.set((str(row["id"]), None), schema_data)
+        
+        return [
+            copy.deepcopy(found[str(schema_id)]) if str(schema_id) in found else None
+            for schema_id in schema_ids
+        ]
     
     def list_schemas(self) -> List[Dict[str, Any]]:
         """List all stored schemas."""
         self._require_connection()
         
         with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
+            self._execute_prepared(
+                cur,
+                "list_schemas",
                 f'SELECT id, name, version FROM {self._table_name("schemas")} '
-                'ORDER BY name, version'
+                'ORDER BY name, version',
+                (),
             )
             return [
                 {
@@ -323,16 +748,45 @@ class PostgresMetadataStore(MetadataStoreClient):
         self._require_connection()
         
         with self._connection.cursor() as cur:
-            cur.execute(f"""
+            self._execute_prepared(cur, "store_governance_rule", f"""
                 INSERT INTO {self._table_name("governance_rules")} (name, rule_definition, schema_id)
-                VALUES (%s, %s, %s)
+                VALUES ($1, $2, $3)
                 RETURNING id
-            """, (rule_name, json.dumps(rule_definition), schema_id))
+            """, (rule_name, _json_dumps(rule_definition), schema_id))
             
             rule_id = cur.fetchone()[0]
-            self._connection.commit()
+            self._commit()
             return str(rule_id)
     
+    def store_governance_rules(
+        self,
+        rules: List[Tuple[str, Dict[str, Any], Optional[str]]],
+    ) -> List[str]:
+        """Store several governance rules with one multi-row INSERT."""
+        self._require_connection()
+        
+        if not rules:
+            return []
+        
+        rows = [
+            (rule_name, _json_dumps(rule_definition), schema_id)
+            for rule_name, rule_definition, schema_id in rules
+        ]
+        with self._connection.cursor() as cur:
+            result = execute_values(
+                cur,
+                f"""
+                INSERT INTO {self._table_name("governance_rules")} (name, rule_definition, schema_id)
+                VALUES %s
+                RETURNING id
+                """,
+                rows,
+                page_size=500,
+                fetch=True,
+            )
+            self._commit()
+            return [str(row[0]) for row in result]
+    
     def get_governance_rules(
         self, schema_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -341,16 +795,16 @@ class PostgresMetadataStore(MetadataStoreClient):
         
         with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
             if schema_id:
-                cur.execute(f"""
+                self._execute_prepared(cur, "get_governance_rules_for_schema", f"""
                     SELECT id, name, rule_definition, schema_id
                     FROM {self._table_name("governance_rules")}
-                    WHERE schema_id = %s
+                    WHERE schema_id = $1
                 """, (schema_id,))
             else:
-                cur.execute(f"""
+                self._execute_prepared(cur, "get_governance_rules", f"""
                     SELECT id, name, rule_definition, schema_id
                     FROM {self._table_name("governance_rules")}
-                """)
+                """, ())
             
             return [
                 {
@@ -375,40 +829,54 @@ class PostgresMetadataStore(MetadataStoreClient):
         self._require_connection()
         
         with self._connection.cursor() as cur:
-            cur.execute(f"""
+            self._execute_prepared(cur, "store_ownership", f"""
                 INSERT INTO {self._table_name("ownership")} (resource_id, owner, team, additional_info)
-                VALUES (%s, %s, %s, %s)
+                VALUES ($1, $2, $3, $4)
                 ON CONFLICT (resource_id)
                 DO UPDATE SET
                     owner = EXCLUDED.owner,
                     team = EXCLUDED.team,
                     additional_info = EXCLUDED.additional_info,
                     updated_at = CURRENT_TIMESTAMP
-            """, (resource_id, owner, team, json.dumps(additional_info or {})))
+            """, (resource_id, owner, team, _json_dumps(additional_info or {})))
             
-            self._connection.commit()
-            return resource_id
+            self._commit()
+        
+        self._query_cache.pop(("ownership", resource_id))
+        return resource_id
     
     def get_ownership(self, resource_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve ownership information."""
+        """
+        Retrieve ownership information.
+        
+        Results are cached for 60 seconds; storing ownership invalidates its entry.
+        """
         self._require_connection()
         
+        cache_key = ("ownership", resource_id)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(f"""
+            self._execute_prepared(cur, "get_ownership", f"""
                 SELECT owner, team, additional_info
                 FROM {self._table_name("ownership")}
-                WHERE resource_id = %s
+                WHERE resource_id = $1
             """, (resource_id,))
             
             row = cur.fetchone()
             if not row:
                 return None
             
-            return {
+            ownership = {
                 "owner": row["owner"],
                 "team": row.get("team"),
                 "additional_info": self._parse_jsonb(row.get("additional_info")),
             }
+        
+        self._query_cache.set(cache_key, ownership)
+        return copy.deepcopy(ownership)
     
     # Metadata
     
@@ -422,36 +890,84 @@ class PostgresMetadataStore(MetadataStoreClient):
         self._require_connection()
         
         with self._connection.cursor() as cur:
-            cur.execute(f"""
+            self._execute_prepared(cur, "store_metadata", f"""
                 INSERT INTO {self._table_name("metadata_record")} (resource_id, resource_type, metadata_data)
-                VALUES (%s, %s, %s)
+                VALUES ($1, $2, $3)
                 ON CONFLICT (resource_id, resource_type)
                 DO UPDATE SET metadata_data = EXCLUDED.metadata_data
                 RETURNING id
-            """, (resource_id, resource_type, json.dumps(metadata)))
+            """, (resource_id, resource_type, _json_dumps(metadata)))
             
             metadata_id = cur.fetchone()[0]
-            self._connection.commit()
-            return f"{resource_type}:{resource_id}"
+            self._commit()
+        
+        self._query_cache.pop(("metadata", resource_id, resource_type))
+        return f"{resource_type}:{resource_id}"
+    
+    def store_metadata_bulk(
+        self,
+        items: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """Store metadata for several resources with one multi-row INSERT."""
+        self._require_connection()
+        
+        if not items:
+            return []
+        
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+        # statement, so keep only the last metadata for each resource
+        rows: Dict[Tuple[str, str], str] = {}
+        for resource_id, metadata, resource_type in items:
+            rows[(resource_id, resource_type)] = _json_dumps(metadata)
+        
+        with self._connection.cursor() as cur:
+            execute_values(
+                cur,
+                f"""
+                INSERT INTO {self._table_name("metadata_record")} (resource_id, resource_type, metadata_data)
+                VALUES %s
+                ON CONFLICT (resource_id, resource_type)
+                DO UPDATE SET metadata_data = EXCLUDED.metadata_data
+                """,
+                [(resource_id, resource_type, data) for (resource_id, resource_type), data in rows.items()],
+                page_size=500,
+            )
+            self._commit()
+        
+        for resource_id, resource_type in rows:
+            self._query_cache.pop(("metadata", resource_id, resource_type))
+        return [f"{resource_type}:{resource_id}" for resource_id, _, resource_type in items]
     
     def get_metadata(
         self, resource_id: str, resource_type: str = "schema"
     ) -> Optional[Dict[str, Any]]:
-        """Retrieve metadata."""
+        """
+        Retrieve metadata.
+        
+        Results are cached for 60 seconds; storing metadata invalidates its entry.
+        """
         self._require_connection()
         
+        cache_key = ("metadata", resource_id, resource_type)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         with self._connection.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(f"""
+            self._execute_prepared(cur, "get_metadata", f"""
                 SELECT metadata_data
                 FROM {self._table_name("metadata_record")}
-                WHERE resource_id = %s AND resource_type = %s
+                WHERE resource_id = $1 AND resource_type = $2
             """, (resource_id, resource_type))
             
             row = cur.fetchone()
             if not row:
                 return None
             
-            return self._parse_jsonb(row["metadata_data"])
+            metadata = self._parse_jsonb(row["metadata_data"])
+        
+        self._query_cache.set(cache_key, metadata)
+        return copy.deepcopy(metadata)
     
     # Coercion rules
     
@@ -483,10 +999,10 @@ class PostgresMetadataStore(MetadataStoreClient):
                 ON CONFLICT (schema_id, version)
                 DO UPDATE SET rules = EXCLUDED.rules
                 RETURNING id
-            """, (schema_id_int, version, json.dumps(coercion_rules)))
+            """, (schema_id_int, version, _json_dumps(coercion_rules)))
             
             rule_id = cur.fetchone()[0]
-            self._connection.commit()
+            self._commit()
             return f"coercion:{schema_id}" + (f":{version}" if version else "")
     
     def get_coercion_rules(
@@ -558,10 +1074,10 @@ class PostgresMetadataStore(MetadataStoreClient):
                 ON CONFLICT (schema_id, version)
                 DO UPDATE SET rules = EXCLUDED.rules
                 RETURNING id
-            """, (schema_id_int, version, json.dumps(validation_rules)))
+            """, (schema_id_int, version, _json_dumps(validation_rules)))
             
             rule_id = cur.fetchone()[0]
-            self._connection.commit()
+            self._commit()
             return f"validation:{schema_id}" + (f":{version}" if version else "")
     
     def get_validation_rules(
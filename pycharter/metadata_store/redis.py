@@ -5,7 +5,7 @@ Stores metadata in Redis using JSON serialization.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import redis
@@ -102,6 +102,49 @@ class RedisMetadataStore(MetadataStoreClient):
         if not self._client:
             raise RuntimeError("Not connected. Call connect() first.")
         
+        # Write the schema and its index entry in one round-trip
+        pipe = self._client.pipeline(transaction=True)
+        schema_id = self._queue_schema(pipe, schema_name, schema, version)
+        pipe.execute()
+        
+        return schema_id
+    
+    def store_schemas_bulk(
+        self,
+        schemas: List[Tuple[str, Dict[str, Any], str]],
+    ) -> List[str]:
+        """
+        Store several schemas using a single pipeline.
+        
+        The pipeline is flushed every 500 commands to bound client memory.
+        
+        Args:
+            schemas: List of (schema_name, schema, version) tuples
+            
+        Returns:
+            List of schema IDs, in the same order as the input schemas
+        """
+        if not self._client:
+            raise RuntimeError("Not connected. Call connect() first.")
+        
+        schema_ids = []
+        pipe = self._client.pipeline(transaction=False)
+        for schema_name, schema, version in schemas:
+            schema_ids.append(self._queue_schema(pipe, schema_name, schema, version))
+            if len(pipe) >= 500:
+                pipe.execute()
+        pipe.execute()
+        
+        return schema_ids
+    
+    def _queue_schema(
+        self,
+        pipe: Any,
+        schema_name: str,
+        schema: Dict[str, Any],
+        version: str,
+    ) -> str:
+        """Queue the commands that store a schema on a pipeline and return its ID."""
         # Ensure schema has version
         if "version" not in schema:
             schema = dict(schema)  # Make a copy
@@ -122,13 +165,13 @@ class RedisMetadataStore(MetadataStoreClient):
             "version": version,
             "schema": schema,
         }
-        self._client.set(
+        pipe.set(
             self._key("schemas", schema_id),
             json.dumps(schema_data)
         )
         
         # Add to index
-        self._client.sadd(self._key("schemas", "index"), schema_id)
+        pipe.sadd(self._key("schemas", "index"), schema_id)
         
         return schema_id
     
@@ -7,7 +7,9 @@ a corresponding Pydantic model.
 
 from pycharter.pydantic_generator.generator import generate_model, generate_model_file
 from pycharter.pydantic_generator.converter import (
+    clear_model_cache,
     from_dict,
+    from_dict_list,
     from_file,
     from_json,
     from_url,
@@ -16,7 +18,9 @@ from pycharter.pydantic_generator.converter import (
 __all__ = [
     "generate_model",
     "generate_model_file",
+    "clear_model_cache",
     "from_dict",
+    "from_dict_list",
     "from_file",
     "from_json",
     "from_url",
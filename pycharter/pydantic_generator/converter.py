@@ -2,22 +2,85 @@
 Main converter module providing a clean API for JSON schema to Pydantic conversion.
 """
 
-import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
-from pydantic import BaseModel
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
 
 from pycharter.pydantic_generator.generator import schema_to_model
+from pycharter.shared.schema_cache import cache_schema, get_cached_schema, schema_hash
 from pycharter.shared.schema_parser import validate_schema
 
 import yaml
 
+# Use the libyaml-backed parser when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Generated models keyed by (schema hash, model name), least recently used first
+_MODEL_CACHE: "OrderedDict[Tuple[bytes, str], Type[BaseModel]]" = OrderedDict()
+_MODEL_CACHE_MAXSIZE = 1024
+
+# Models loaded by from_file() keyed by (resolved path, mtime_ns, model name),
+# so an unchanged file is not re-read or re-parsed
+_FILE_CACHE: "OrderedDict[Tuple[str, int, str], Type[BaseModel]]" = OrderedDict()
+
+# Guards both caches; _cache_generation is bumped on every clear so a model
+# built before a clear is not stored after it
+_cache_lock = threading.Lock()
+_cache_generation = 0
+
+
+def _cache_get(cache: "OrderedDict[Any, Type[BaseModel]]", key: Any) -> Optional[Type[BaseModel]]:
+    with _cache_lock:
+        model = cache.get(key)
+        if model is not None:
+            cache.move_to_end(key)
+        return model
+
+
+def _cache_put(
+    cache: "OrderedDict[Any, Type[BaseModel]]",
+    key: Any,
+    model: Type[BaseModel],
+    generation: int,
+) -> None:
+    with _cache_lock:
+        if generation != _cache_generation:
+            return
+        cache[key] = model
+        if len(cache) > _MODEL_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+
+
+def clear_model_cache() -> None:
+    """
+    Drop all cached models built by from_dict(), from_file() and friends.
+    
+    Called automatically by register_validation() and register_coercion(),
+    since generated models hold on to the registered functions. Also useful
+    in long-running processes that generate many distinct schemas, or in
+    tests that need a fresh model class.
+    """
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _MODEL_CACHE.clear()
+        _FILE_CACHE.clear()
+
 
 def from_dict(schema: Dict[str, Any], model_name: str = "DynamicModel") -> Type[BaseModel]:
     """
     Convert a JSON schema dictionary to a Pydantic model.
     
+    Generated models are cached by a hash of the schema and the model name,
+    so converting the same schema again returns the same class. The model's
+    field names are available as the ``__pycharter_field_names__`` tuple. If the
+    persistent schema cache is enabled (PYCHARTER_SCHEMA_CACHE_DIR), schemas
+    validated in an earlier process are not validated again.
+    
     Args:
         schema: The JSON schema as a dictionary (must contain "version" field)
         model_name: Name for the generated Pydantic model class
@@ -45,7 +108,18 @@ def from_dict(schema: Dict[str, Any], model_name: str = "DynamicModel") -> Type[
         >>> person.age
         30
     """
-    validate_schema(schema)
+    generation = _cache_generation
+    key = schema_hash(schema)
+    previously_validated = False
+    if key is not None:
+        cache_key = (key, model_name)
+        model = _cache_get(_MODEL_CACHE, cache_key)
+        if model is not None:
+            return model
+        previously_validated = get_cached_schema(key) is not None
+    
+    if not previously_validated:
+        validate_schema(schema)
     
     # Ensure schema has version
     if "version" not in schema:
@@ -54,7 +128,68 @@ def from_dict(schema: Dict[str, Any], model_name: str = "DynamicModel") -> Type[
             "Please add 'version': '<version_string>' to your schema."
         )
     
-    return schema_to_model(schema, model_name)
+    model = schema_to_model(schema, model_name)
+    # Field names as an immutable tuple, for cheap repeated introspection
+    setattr(model, "__pycharter_field_names__", tuple(model.model_fields))
+    
+    if key is not None:
+        _cache_put(_MODEL_CACHE, cache_key, model, generation)
+        if not previously_validated:
+            cache_schema(key, pydantic_core.to_json(schema))
+    
+    return model
+
+
+def from_dict_list(
+    schema: Dict[str, Any],
+    model_name: str,
+    rows: Iterable[Dict[str, Any]],
+) -> List[BaseModel]:
+    """
+    Convert a JSON schema to a Pydantic model and validate a list of rows with it.
+    
+    The whole list is validated in a single pass through pydantic-core using a
+    TypeAdapter for List[Model]. The adapter is built once and cached on the
+    model class, so repeated calls with the same schema reuse it.
+    
+    Args:
+        schema: The JSON schema as a dictionary (must contain "version" field)
+        model_name: Name for the generated Pydantic model class
+        rows: Iterable of dictionaries to validate
+        
+    Returns:
+        List of model instances, in the same order as the input rows
+        
+    Raises:
+        ValueError: If schema does not have a "version" field
+        pydantic.ValidationError: If any row is invalid
+        
+    Example:
+        >>> items = from_dict_list(schema, "Item", [{"name": "a"}, {"name": "b"}])
+        >>> len(items)
+        2
+    """
+    model = from_dict(schema, model_name)
+    if not isinstance(rows, list):
+        rows = list(rows)
+    return list_adapter(model).validate_python(rows)
+
+
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Get a TypeAdapter for List[model], built once and cached on the model class.
+    
+    Args:
+        model: Pydantic model class
+        
+    Returns:
+        TypeAdapter that validates a list of rows in one pydantic-core call
+    """
+    adapter = model.__dict__.get("__pycharter_adapter__")
+    if adapter is None:
+        adapter = TypeAdapter(List[model])  # type: ignore[valid-type]
+        setattr(model, "__pycharter_adapter__", adapter)
+    return adapter
 
 
 def from_json(json_string: str, model_name: str = "DynamicModel") -> Type[BaseModel]:
@@ -83,7 +218,7 @@ def from_json(json_string: str, model_name: str = "DynamicModel") -> Type[BaseMo
         ... '''
         >>> Person = from_json(schema_json, "Person")
     """
-    schema = json.loads(json_string)
+    schema = pydantic_core.from_json(json_string)
     return from_dict(schema, model_name)
 
 
@@ -93,6 +228,9 @@ def from_file(file_path: Union[str, Path], model_name: Optional[str] = None) ->
     
     Supports both JSON (.json) and YAML (.yaml, .yml) file formats.
     
+    Models are cached by file path and modification time, so loading an
+    unchanged file again returns the same class without re-reading it.
+    
     Args:
         file_path: Path to the schema file (JSON or YAML, must contain "version" field)
         model_name: Name for the generated Pydantic model class.
@@ -119,21 +257,28 @@ def from_file(file_path: Union[str, Path], model_name: Optional[str] = None) ->
     if model_name is None:
         model_name = path.stem.capitalize()
     
+    generation = _cache_generation
+    file_key = (str(path.resolve()), path.stat().st_mtime_ns, model_name)
+    model = _cache_get(_FILE_CACHE, file_key)
+    if model is not None:
+        return model
+    
     # Determine file format
     suffix = path.suffix.lower()
     
     if suffix in [".yaml", ".yml"]:
-        with open(path, "r", encoding="utf-8") as f:
-            schema = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            schema = yaml.load(f, Loader=_YamlLoader)
     elif suffix == ".json":
-        with open(path, "r", encoding="utf-8") as f:
-            schema = json.load(f)
+        schema = pydantic_core.from_json(path.read_bytes())
     else:
         raise ValueError(
             f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml"
         )
     
-    return from_dict(schema, model_name)
+    model = from_dict(schema, model_name)
+    _cache_put(_FILE_CACHE, file_key, model, generation)
+    return model
 
 
 def from_url(url: str, model_name: str = "DynamicModel") -> Type[BaseModel]:
@@ -158,7 +303,7 @@ def from_url(url: str, model_name: str = "DynamicModel") -> Type[BaseModel]:
         import urllib.request
         
         with urllib.request.urlopen(url) as response:
-            schema = json.loads(response.read().decode())
+            schema = pydantic_core.from_json(response.read())
         
         return from_dict(schema, model_name)
     except ImportError:
@@ -204,7 +204,7 @@ def schema_to_model(
         return create_model(model_name)
     
     # Build field definitions and collect validators
-    field_definitions: Dict[str, tuple[Type[Any], Any]] = {}
+    field_definitions: Dict[str, Any] = {}  # name -> (type, default or FieldInfo)
     coercion_validators: Dict[str, Any] = {}  # field_name -> coercion function
     validation_validators: Dict[str, List[Any]] = {}  # field_name -> list of validation functions
     
@@ -402,7 +402,7 @@ def schema_to_model(
             )
     
     # Build class dictionary with validators
-    class_dict = {}
+    class_dict: Dict[str, Any] = {}
     
     # Add coercion validators (mode='before')
     for field_name, coercion_func in coercion_validators.items():
@@ -431,14 +431,10 @@ def schema_to_model(
             
             class_dict[f"_validate_{field_name}_{idx}"] = make_validation_validator(field_name, validation_func)
     
-    # Create the model with validators
-    if class_dict:
-        # Create base model first, then subclass with validators
-        base_model = create_model(model_name, **field_definitions)
-        return type(model_name, (base_model,), class_dict)
-    else:
-        # No validators, just create the model
-        return create_model(model_name, **field_definitions)
+    # Create the model with validators in a single step, so the core schema
+    # (and its validator) is built once rather than for a base class and again
+    # for a validator subclass
+    return create_model(model_name, __validators__=class_dict, **field_definitions)
 
 
 def generate_model(schema: Dict[str, Any], model_name: str = "DynamicModel") -> Type[BaseModel]:
@@ -18,6 +18,7 @@ from pycharter.runtime_validator.runtime_validator import (
     validate_with_store,
 )
 from pycharter.runtime_validator.validator import (
+    try_validate,
     validate,
     validate_batch,
     ValidationResult,
@@ -27,6 +28,7 @@ __all__ = [
     # Core validation functions
     "validate",
     "validate_batch",
+    "try_validate",
     "ValidationResult",
     # Database-backed validation
     "validate_with_store",
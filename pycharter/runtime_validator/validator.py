@@ -4,10 +4,12 @@ Runtime Validator - Lightweight validation utility.
 Uses generated Pydantic models to validate data in data processing scripts.
 """
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel, ValidationError
 
+from pycharter.pydantic_generator.converter import list_adapter
+
 
 class ValidationResult:
     """
@@ -19,6 +21,9 @@ class ValidationResult:
         errors: List of validation errors if invalid
     """
     
+    # One result is created per validated record; slots keep them small
+    __slots__ = ("is_valid", "data", "errors")
+    
     def __init__(
         self,
         is_valid: bool,
@@ -42,6 +47,10 @@ def validate(
     """
     Validate data against a Pydantic model.
     
+    Data is passed straight to the model's compiled pydantic-core validator
+    (model_validate) rather than unpacked into the constructor as keyword
+    arguments.
+    
     Args:
         model: Pydantic model class (generated from JSON Schema)
         data: Data dictionary to validate
@@ -64,7 +73,7 @@ def validate(
         'Alice'
     """
     try:
-        instance = model(**data)
+        instance = model.model_validate(data)
         return ValidationResult(is_valid=True, data=instance)
     except ValidationError as e:
         errors = [str(err) for err in e.errors()]
@@ -78,6 +87,53 @@ def validate(
         return ValidationResult(is_valid=False, errors=errors)
 
 
+def try_validate(
+    model: Type[BaseModel],
+    data: Dict[str, Any],
+) -> Tuple[bool, Any]:
+    """
+    Validate data against a Pydantic model without raising.
+    
+    A lighter-weight alternative to validate() for bulk checks where many
+    records are expected to fail: errors are returned as pydantic error
+    dictionaries without documentation URLs or context, and are not
+    formatted into strings.
+    
+    Args:
+        model: Pydantic model class (generated from JSON Schema)
+        data: Data dictionary to validate
+        
+    Returns:
+        Tuple of (True, model instance) if valid, or (False, list of error dicts)
+        
+    Example:
+        >>> ok, errors = try_validate(Person, {"name": 123})
+        >>> ok
+        False
+        >>> errors[0]["loc"]
+        ('name',)
+    """
+    try:
+        return True, model.model_validate(data)
+    except ValidationError as e:
+        return False, e.errors(include_url=False, include_context=False)
+
+
+def _validate_each(
+    model: Type[BaseModel],
+    data_list: List[Dict[str, Any]],
+    strict: bool,
+) -> List[ValidationResult]:
+    """Validate items one at a time, stopping at the first failure if strict."""
+    results = []
+    for data in data_list:
+        result = validate(model, data, strict=strict)
+        results.append(result)
+        if strict and not result.is_valid:
+            break
+    return results
+
+
 def validate_batch(
     model: Type[BaseModel],
     data_list: List[Dict[str, Any]],
@@ -86,6 +142,10 @@ def validate_batch(
     """
     Validate a batch of data items against a Pydantic model.
     
+    The whole batch is first validated in a single pydantic-core call. If any
+    item fails, errors are grouped by item index and only the valid items are
+    validated again individually to build their results.
+    
     Args:
         model: Pydantic model class
         data_list: List of data dictionaries to validate
@@ -99,11 +159,38 @@ def validate_batch(
         >>> all(r.is_valid for r in results)
         True
     """
-    results = []
-    for data in data_list:
-        result = validate(model, data, strict=strict)
-        results.append(result)
-        if strict and not result.is_valid:
-            break
+    if not isinstance(data_list, list):
+        data_list = list(data_list)
+    
+    try:
+        instances = list_adapter(model).validate_python(data_list)
+        return [ValidationResult(is_valid=True, data=instance) for instance in instances]
+    except ValidationError as e:
+        if strict:
+            # Re-run item by item so the first invalid item raises its own error
+            for data in data_list:
+                validate(model, data, strict=True)
+            raise
+        errors_by_index: Dict[int, List[str]] = {}
+        for err in e.errors():
+            index, *loc = err["loc"]
+            # The leading loc entry of a list validation error is the item index
+            errors_by_index.setdefault(int(index), []).append(str({**err, "loc": tuple(loc)}))
+    except Exception:
+        # A validator raised something other than a validation error: fall
+        # back to item-by-item validation, which reports it per item
+        return _validate_each(model, data_list, strict)
+    
+    # Items without errors are known to be valid, so validate them directly;
+    # bind the hot-loop callables to locals once
+    model_validate = model.model_validate
+    get_errors = errors_by_index.get
+    results: List[ValidationResult] = []
+    append = results.append
+    for index, data in enumerate(data_list):
+        errors = get_errors(index)
+        if errors:
+            append(ValidationResult(is_valid=False, errors=errors))
+        else:
+            append(ValidationResult(is_valid=True, data=model_validate(data)))
     return results
-
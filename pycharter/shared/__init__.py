@@ -20,6 +20,7 @@ from pycharter.shared.json_schema_support import (
 from pycharter.shared.schema_resolver import normalize_schema_structure, resolve_refs
 from pycharter.shared.schema_parser import (
     get_schema_type,
+    intern_schema_strings,
     is_required,
     normalize_schema,
     validate_schema,
@@ -47,6 +48,7 @@ __all__ = [
     "resolve_refs",
     # Schema parser
     "get_schema_type",
+    "intern_schema_strings",
     "is_required",
     "normalize_schema",
     "validate_schema",
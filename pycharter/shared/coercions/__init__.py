@@ -87,3 +87,8 @@ def register_coercion(name: str, func: Callable[[Any], Any]) -> None:
     """
     COERCION_REGISTRY[name] = func
 
+    # Models generated earlier hold on to the previous function
+    from pycharter.pydantic_generator.converter import clear_model_cache
+
+    clear_model_cache()
+
@@ -9,6 +9,12 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import Field, ValidationInfo
 
+from pycharter.shared.validations.builtin import compile_pattern
+
+# Patterns used for the "uuid" and "email" formats
+_UUID_PATTERN = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+_EMAIL_PATTERN = "^[^@]+@[^@]+\\.[^@]+$"
+
 
 def apply_json_schema_constraints(
     schema: Dict[str, Any], field_name: str
@@ -48,10 +54,10 @@ def apply_json_schema_constraints(
             # For some formats, we can add pattern validation
             if schema["format"] == "uuid":
                 # UUID format validation (basic pattern)
-                field_kwargs["pattern"] = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+                field_kwargs["pattern"] = _UUID_PATTERN
             elif schema["format"] == "email":
                 # Email format validation (basic pattern)
-                field_kwargs["pattern"] = "^[^@]+@[^@]+\\.[^@]+$"
+                field_kwargs["pattern"] = _EMAIL_PATTERN
     
     # Number constraints
     if schema.get("type") in ["number", "integer"]:
@@ -150,9 +156,7 @@ def create_pattern_validator(pattern: str):
     Returns:
         Validation function
     """
-    import re
-    
-    compiled_pattern = re.compile(pattern)
+    compiled_pattern = compile_pattern(pattern)
     
     def _pattern_validator(value: Any, info: ValidationInfo) -> Any:
         if value is None:
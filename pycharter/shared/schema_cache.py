@@ -0,0 +1,141 @@
+"""
+Persistent schema cache.
+
+Stores JSON Schemas that have already been validated, keyed by a canonical
+hash, in a SQLite database so that the work survives process restarts.
+Entries are recorded only by from_dict(), after validate_schema() passes.
+The hash includes the pycharter version, so a schema validated by an older
+release is validated again by a newer one.
+The cache is disabled unless the PYCHARTER_SCHEMA_CACHE_DIR environment
+variable points to a directory.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pycharter import __version__
+
+_connection: Optional[sqlite3.Connection] = None
+_connection_path: Optional[Path] = None
+_lock = threading.Lock()
+
+# Personalization for schema_hash(): ties cache keys to this release
+_HASH_PERSON = hashlib.blake2b(
+    f"pycharter-{__version__}".encode("utf-8"), digest_size=16
+).digest()
+
+
+def schema_hash(schema: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Compute a canonical 16-byte hash of a schema dictionary.
+
+    The pycharter version is mixed into the hash, so cached entries from
+    other releases never match.
+
+    Args:
+        schema: The schema dictionary
+
+    Returns:
+        The hash digest, or None if the schema cannot be serialized to JSON
+    """
+    try:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(
+        canonical.encode("utf-8"), digest_size=16, person=_HASH_PERSON
+    ).digest()
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Get the persistent cache directory.
+
+    Returns:
+        Directory from PYCHARTER_SCHEMA_CACHE_DIR, or None if caching is disabled
+    """
+    cache_dir = os.getenv("PYCHARTER_SCHEMA_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(cache_dir).expanduser()
+
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """Open (or reuse) the cache database for the configured directory."""
+    global _connection, _connection_path
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    db_path = cache_dir / "schemas.sqlite3"
+    if _connection is not None and _connection_path == db_path:
+        return _connection
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS schemas (key BLOB PRIMARY KEY, data BLOB NOT NULL)"
+        )
+    except (OSError, sqlite3.Error):
+        return None
+
+    if _connection is not None:
+        _connection.close()
+    _connection = connection
+    _connection_path = db_path
+    return _connection
+
+
+def get_cached_schema(key: bytes) -> Optional[bytes]:
+    """
+    Look up a cached schema by hash.
+
+    Args:
+        key: Hash returned by schema_hash()
+
+    Returns:
+        The cached JSON Schema bytes, or None on a miss or if caching is disabled
+    """
+    with _lock:
+        connection = _get_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT data FROM schemas WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    return row[0] if row else None
+
+
+def cache_schema(key: bytes, data: bytes) -> None:
+    """
+    Store JSON Schema bytes in the cache.
+
+    Does nothing if caching is disabled.
+
+    Args:
+        key: Hash returned by schema_hash()
+        data: The serialized JSON Schema
+    """
+    with _lock:
+        connection = _get_connection()
+        if connection is None:
+            return
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO schemas (key, data) VALUES (?, ?)",
+                    (key, data),
+                )
+        except sqlite3.Error:
+            pass
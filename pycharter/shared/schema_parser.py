@@ -2,6 +2,7 @@
 Schema parser module for validating and normalizing JSON schemas.
 """
 
+import sys
 from typing import Any, Dict, List, Optional
 
 from pycharter.shared.json_schema_validator import validate_json_schema
@@ -84,3 +85,52 @@ def is_required(field_name: str, schema: Dict[str, Any]) -> bool:
     required_fields = schema.get("required", [])
     return field_name in required_fields
 
+
+# Keywords and type names that repeat across almost every stored schema
+_CANONICAL_STRINGS = frozenset({
+    "type", "properties", "required", "string", "integer", "number", "boolean",
+    "object", "array", "null", "items", "description", "default", "enum",
+    "minimum", "maximum", "minLength", "maxLength", "pattern", "format",
+    "version", "title", "coercion", "validations",
+})
+
+
+def intern_schema_strings(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of a schema with common keywords interned.
+    
+    Schemas parsed from JSON or YAML hold a separate string object for every
+    occurrence of keys such as "type" or "properties". Interning them lets all
+    stored schemas share one object per keyword. The schema is walked with an
+    explicit stack, so deeply nested schemas do not hit the recursion limit.
+    
+    Args:
+        schema: The schema dictionary
+        
+    Returns:
+        A new schema dictionary with the same content
+    """
+    def copy_node(value: Any) -> Any:
+        if isinstance(value, dict):
+            node: Any = {}
+        elif isinstance(value, list):
+            node = []
+        elif isinstance(value, str) and value in _CANONICAL_STRINGS:
+            return sys.intern(value)
+        else:
+            return value
+        stack.append((value, node))
+        return node
+    
+    stack: List[Any] = []
+    root = copy_node(schema)
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if isinstance(key, str) and key in _CANONICAL_STRINGS:
+                    key = sys.intern(key)
+                target[key] = copy_node(value)
+        else:
+            target.extend(copy_node(value) for value in source)
+    return root
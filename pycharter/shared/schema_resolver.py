@@ -2,7 +2,7 @@
 Schema resolver for handling $ref references and definitions/$defs.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 
 def resolve_refs(
@@ -34,6 +34,12 @@ def resolve_refs(
         if "$defs" in base_schema:
             definitions.update(base_schema["$defs"])
     
+    # Each definition is resolved once and reused for every $ref to it.
+    # Definitions still being resolved are tracked so that a self-referential
+    # definition is cut off (as a plain object) instead of recursing forever.
+    resolved_defs: Dict[str, Any] = {}
+    in_progress: Set[str] = set()
+    
     def _resolve(obj: Any, path: str = "#") -> Any:
         """Recursively resolve references."""
         if isinstance(obj, dict):
@@ -47,9 +53,18 @@ def resolve_refs(
                     
                     if ref_parts[0] in ["definitions", "$defs"]:
                         def_name = "/".join(ref_parts[1:])
+                        if def_name in in_progress:
+                            return {"type": "object"}
                         if def_name in definitions:
-                            # Resolve the referenced definition
-                            resolved = _resolve(definitions[def_name], f"{path}/$ref")
+                            # Resolve the referenced definition (once)
+                            resolved = resolved_defs.get(def_name)
+                            if resolved is None:
+                                in_progress.add(def_name)
+                                try:
+                                    resolved = _resolve(definitions[def_name], f"{path}/$ref")
+                                finally:
+                                    in_progress.discard(def_name)
+                                resolved_defs[def_name] = resolved
                             # Merge any other properties from the $ref object
                             other_props = {k: v for k, v in obj.items() if k != "$ref"}
                             if other_props:
@@ -78,3 +78,8 @@ def register_validation(name: str, func: Callable) -> None:
     """
     VALIDATION_REGISTRY[name] = func
 
+    # Models generated earlier hold on to the previous function
+    from pycharter.pydantic_generator.converter import clear_model_cache
+
+    clear_model_cache()
+
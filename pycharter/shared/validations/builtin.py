@@ -3,10 +3,37 @@ Built-in validation functions for common validation rules.
 """
 
 import re
-from typing import Any, List
+from typing import Any, Dict, List
 
 from pydantic import ValidationInfo
 
+# Compiled regular expressions shared by every generated model, keyed by pattern
+_PATTERN_CACHE: Dict[str, "re.Pattern[str]"] = {}
+
+
+def compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a regular expression once and reuse it for every later request.
+    
+    Args:
+        pattern: Regular expression pattern
+        
+    Returns:
+        The compiled pattern
+    """
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE.setdefault(pattern, re.compile(pattern))
+    return compiled
+
+
+_NO_SPECIAL_CHARACTERS_RE = compile_pattern(r'^[a-zA-Z0-9\s]*$')
+# Basic email regex (RFC 5322 simplified)
+_EMAIL_RE = compile_pattern(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Basic URL pattern
+_URL_RE = compile_pattern(r'^https?://[^\s/$.?#].[^\s]*$')
+_NUMERIC_STRING_RE = compile_pattern(r'^-?\d+(\.\d+)?$')
+
 
 def min_length(threshold: int):
     """
@@ -238,7 +265,7 @@ def no_special_characters():
         if value is None:
             return value
         if isinstance(value, str):
-            if not re.match(r'^[a-zA-Z0-9\s]*$', value):
+            if not _NO_SPECIAL_CHARACTERS_RE.match(value):
                 raise ValueError(
                     "String must contain only alphanumeric characters and spaces"
                 )
@@ -256,6 +283,8 @@ def matches_regex(pattern: str):
     Returns:
         Validation function
     """
+    compiled_pattern = compile_pattern(pattern)
+    
     def _matches_regex(value: Any, info: ValidationInfo) -> Any:
         """
         Validate that string matches the given regex pattern.
@@ -269,7 +298,7 @@ def matches_regex(pattern: str):
         if value is None:
             return value
         if isinstance(value, str):
-            if not re.match(pattern, value):
+            if not compiled_pattern.match(value):
                 raise ValueError(
                     f"String must match pattern '{pattern}', got '{value}'"
                 )
@@ -297,9 +326,7 @@ def is_email():
         if value is None:
             return value
         if isinstance(value, str):
-            # Basic email regex (RFC 5322 simplified)
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, value):
+            if not _EMAIL_RE.match(value):
                 raise ValueError(f"String must be a valid email address, got '{value}'")
         return value
     return _is_email
@@ -325,9 +352,7 @@ def is_url():
         if value is None:
             return value
         if isinstance(value, str):
-            # Basic URL pattern
-            url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-            if not re.match(url_pattern, value):
+            if not _URL_RE.match(value):
                 raise ValueError(f"String must be a valid URL, got '{value}'")
         return value
     return _is_url
@@ -381,7 +406,7 @@ def is_numeric_string():
         if value is None:
             return value
         if isinstance(value, str):
-            if not re.match(r'^-?\d+(\.\d+)?$', value):
+            if not _NUMERIC_STRING_RE.match(value):
                 raise ValueError(
                     f"String must be numeric, got '{value}'"
                 )
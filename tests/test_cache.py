@@ -0,0 +1,51 @@
+"""
+Tests for the query-result cache used by metadata stores.
+"""
+
+from pycharter.cache import QueryCache
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving a value."""
+        cache = QueryCache(maxsize=10, ttl=60)
+        cache.set(("1", None), {"type": "object"})
+
+        assert cache.get(("1", None)) == {"type": "object"}
+        assert cache.get(("2", None)) is None
+        assert cache.cache_info()["hits"] == 1
+        assert cache.cache_info()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = QueryCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = QueryCache(maxsize=10, ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        """Test invalidating entries."""
+        cache = QueryCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,167 @@
+"""
+Tests for the SQLAlchemy models (no database required).
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_isolated(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, so no other model module is preloaded."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60
+    )
+
+
+class TestLazyModelLoading:
+    """Tests for the lazily loaded pycharter.db.models package."""
+
+    @pytest.mark.parametrize(
+        "module, model",
+        [
+            ("systems", "SystemModel"),
+            ("schemas", "SchemaModel"),
+            ("data_feeds", "DataFeedModel"),
+            ("data_contracts", "DataContractModel"),
+        ],
+    )
+    def test_model_module_imported_on_its_own_configures(self, module, model):
+        """Test that mappers configure when only one model module was imported."""
+        result = _run_isolated(
+            f"from pycharter.db.models.{module} import {model}\n"
+            "from sqlalchemy.orm import configure_mappers\n"
+            "configure_mappers()\n"
+        )
+        assert result.returncode == 0, result.stderr
+
+
+class TestContractFullLoad:
+    """Tests for contract_full_load() and load_full_contracts()."""
+
+    def test_options_build_from_data_contracts_module_alone(self):
+        """Test that the options build when only data_contracts was imported."""
+        result = _run_isolated(
+            "from pycharter.db.models.data_contracts import contract_full_load\n"
+            "contract_full_load()\n"
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_select_with_options_compiles(self):
+        """Test that a contract query with all loader options compiles."""
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+
+        from pycharter.db.models.data_contracts import (
+            DataContractModel,
+            contract_full_load,
+        )
+
+        statement = (
+            select(DataContractModel)
+            .where(DataContractModel.name == "Aircraft")
+            .options(*contract_full_load())
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        # To-one references are joined into the contract query
+        assert "LEFT OUTER JOIN pycharter.schemas" in sql
+        assert "LEFT OUTER JOIN pycharter.data_feeds" in sql
+        assert "WHERE pycharter.data_contracts.name" in sql
+
+
+class _RecordingSession:
+    """Stand-in for a Session that records execute() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, statement, params=None):
+        self.calls.append((statement, params))
+
+
+class TestBulkSetRelationships:
+    """Tests for bulk_set_relationships()."""
+
+    def test_one_insert_per_join_table(self):
+        """Test that each non-empty join table is written with one statement."""
+        from pycharter.db.models.data_contracts import bulk_set_relationships
+
+        session = _RecordingSession()
+        bulk_set_relationships(
+            session,
+            7,
+            system_pulls=[1, 2],
+            system_sources=[3],
+            team_access=[(4, "read")],
+        )
+
+        tables = [statement.table.name for statement, _ in session.calls]
+        assert tables == ["data_contract_system_links", "data_contract_team_access"]
+        assert session.calls[0][1] == [
+            {"data_contract_id": 7, "system_id": 1, "relation_type": "pull"},
+            {"data_contract_id": 7, "system_id": 2, "relation_type": "pull"},
+            {"data_contract_id": 7, "system_id": 3, "relation_type": "source"},
+        ]
+        assert session.calls[1][1] == [
+            {"data_contract_id": 7, "team_id": 4, "permission": "read"},
+        ]
+
+    def test_statements_are_reused(self):
+        """Test that the same statement object is used whatever the row count."""
+        from pycharter.db.models.data_contracts import bulk_set_relationships
+
+        first, second = _RecordingSession(), _RecordingSession()
+        bulk_set_relationships(first, 1, business_owners=[1])
+        bulk_set_relationships(second, 2, business_owners=[1, 2, 3])
+
+        assert first.calls[0][0] is second.calls[0][0]
+
+    def test_conflicts_are_ignored(self):
+        """Test that existing links are skipped with ON CONFLICT DO NOTHING."""
+        from sqlalchemy.dialects import postgresql
+
+        from pycharter.db.models.data_contracts import bulk_set_relationships
+
+        session = _RecordingSession()
+        bulk_set_relationships(session, 1, feed_dependencies=[(5, "required")])
+
+        sql = str(session.calls[0][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT pk_data_feed_dependency DO NOTHING" in sql
+
+
+class TestSystemLinkViews:
+    """Tests for the relation_type views over DataContractSystemLink."""
+
+    def test_views_filter_by_relation_type(self):
+        """Test that system_pulls can be used in a query filter."""
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+
+        from pycharter.db.models.data_contracts import DataContractModel
+
+        statement = select(DataContractModel.id).where(
+            DataContractModel.system_pulls.any(system_id=3)
+        )
+        sql = str(
+            statement.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert "relation_type = 'pull'" in sql
+
+    def test_views_are_read_only(self):
+        """Test that the filtered views are view-only relationships."""
+        from sqlalchemy import inspect
+
+        from pycharter.db.models.data_contracts import DataContractModel
+        from pycharter.db.models.systems import SystemModel
+
+        contract = inspect(DataContractModel).relationships
+        system = inspect(SystemModel).relationships
+        assert not contract["system_links"].viewonly
+        for name in ("system_pulls", "system_pushes", "system_sources"):
+            assert contract[name].viewonly
+        for name in ("data_contracts_pull_from", "data_contracts_push_to", "data_contracts_source"):
+            assert system[name].viewonly
@@ -222,6 +222,21 @@ class TestToDict:
         assert result_schema["properties"]["name"]["type"] == "string"
         assert result_schema["properties"]["age"]["type"] == "integer"
 
+    def test_schema_is_cached_per_model(self):
+        """Test that repeated conversions reuse the schema but return copies."""
+        from pycharter.json_schema_converter import reverse_converter
+
+        class CachedModel(BaseModel):
+            name: str
+
+        first = to_dict(CachedModel)
+        first["properties"]["name"]["type"] = "integer"
+        second = to_dict(CachedModel)
+
+        assert second["properties"]["name"]["type"] == "string"
+        assert CachedModel in reverse_converter._SCHEMA_CACHE
+        assert to_dict(CachedModel, title="Other")["title"] == "Other"
+
 
 class TestToJson:
     """Tests for to_json function."""
@@ -0,0 +1,131 @@
+"""
+Tests for the bulk write methods of the metadata stores (no database required).
+"""
+
+import pytest
+
+from pycharter import InMemoryMetadataStore
+from pycharter.metadata_store.client import MetadataStoreClient
+
+
+class _DictStore(MetadataStoreClient):
+    """Minimal store that only implements the single-item methods."""
+
+    def __init__(self):
+        super().__init__()
+        self.metadata_calls = []
+        self._metadata = {}
+        self._rules = []
+
+    def store_governance_rule(self, rule_name, rule_definition, schema_id=None):
+        rule_id = f"r{len(self._rules)}"
+        self._rules.append(
+            {"id": rule_id, "name": rule_name, "definition": rule_definition, "schema_id": schema_id}
+        )
+        return rule_id
+
+    def get_governance_rules(self, schema_id=None):
+        return [r for r in self._rules if schema_id is None or r["schema_id"] == schema_id]
+
+    def store_metadata(self, resource_id, metadata, resource_type="schema"):
+        self.metadata_calls.append(resource_id)
+        key = f"{resource_type}/{resource_id}"
+        self._metadata[key] = metadata
+        return key
+
+    def get_metadata(self, resource_id, resource_type="schema"):
+        return self._metadata.get(f"{resource_type}/{resource_id}")
+
+
+@pytest.fixture
+def in_memory_store():
+    store = InMemoryMetadataStore()
+    store.connect()
+    yield store
+    store.disconnect()
+
+
+class TestStoreMetadataBulk:
+    """Tests for store_metadata_bulk()."""
+
+    def test_in_memory_store(self, in_memory_store):
+        """Test that IDs are returned in input order and the items round-trip."""
+        store = in_memory_store
+        store.store_metadata("schema_1", {"description": "Original"}, "schema")
+
+        metadata_ids = store.store_metadata_bulk([
+            ("schema_1", {"description": "Updated"}, "schema"),
+            ("rule_1", {"description": "Rule metadata"}, "rule"),
+            ("schema_2", {"description": "Second schema"}, "schema"),
+        ])
+
+        assert metadata_ids == ["schema:schema_1", "rule:rule_1", "schema:schema_2"]
+        assert store.get_metadata("schema_1", "schema") == {"description": "Updated"}
+        assert store.get_metadata("rule_1", "rule") == {"description": "Rule metadata"}
+        assert store.get_metadata("schema_2") == {"description": "Second schema"}
+        assert store.get_metadata("rule_1", "schema") is None
+
+    def test_in_memory_store_empty(self, in_memory_store):
+        """Test that an empty batch stores nothing."""
+        assert in_memory_store.store_metadata_bulk([]) == []
+
+    def test_client_default_calls_store_metadata_per_item(self):
+        """Test that the base implementation stores each item in order."""
+        store = _DictStore()
+
+        metadata_ids = store.store_metadata_bulk([
+            ("b", {"owner": "team-b"}, "schema"),
+            ("a", {"owner": "team-a"}, "rule"),
+        ])
+
+        assert metadata_ids == ["schema/b", "rule/a"]
+        assert store.metadata_calls == ["b", "a"]
+        assert store.get_metadata("b") == {"owner": "team-b"}
+        assert store.get_metadata("a", "rule") == {"owner": "team-a"}
+
+
+class TestStoreGovernanceRules:
+    """Tests for store_governance_rules()."""
+
+    def test_in_memory_store(self, in_memory_store):
+        """Test that IDs continue the store's sequence and keep input order."""
+        store = in_memory_store
+        schema_id = store.store_schema("user", {"type": "object"}, version="1.0")
+        rule_id = store.store_governance_rule("first", {"type": "validation"}, schema_id)
+
+        rule_ids = store.store_governance_rules([
+            ("retention", {"days": 30}, schema_id),
+            ("pii", {"enabled": True}, None),
+            ("masking", {"fields": ["email"]}, schema_id),
+        ])
+
+        assert rule_id == "rule_2"
+        assert rule_ids == ["rule_3", "rule_4", "rule_5"]
+        assert store.store_governance_rule("last", {}, schema_id) == "rule_6"
+        assert [r["name"] for r in store.get_governance_rules(schema_id)] == [
+            "first", "retention", "masking", "last",
+        ]
+        rules = {r["id"]: r for r in store.get_governance_rules()}
+        assert rules["rule_4"] == {
+            "id": "rule_4", "name": "pii", "definition": {"enabled": True}, "schema_id": None,
+        }
+
+    def test_in_memory_store_empty(self, in_memory_store):
+        """Test that an empty batch does not consume IDs."""
+        store = in_memory_store
+        assert store.store_governance_rules([]) == []
+        assert store.store_governance_rule("only", {}) == "rule_1"
+
+    def test_client_default_calls_store_governance_rule_per_rule(self):
+        """Test that the base implementation stores each rule in order."""
+        store = _DictStore()
+
+        rule_ids = store.store_governance_rules([
+            ("b", {"n": 1}, "schema_1"),
+            ("a", {"n": 2}, None),
+            ("c", {"n": 3}, "schema_1"),
+        ])
+
+        assert rule_ids == ["r0", "r1", "r2"]
+        assert [r["name"] for r in store.get_governance_rules()] == ["b", "a", "c"]
+        assert [r["name"] for r in store.get_governance_rules("schema_1")] == ["b", "c"]
@@ -64,7 +64,7 @@ def test_in_memory_store():
         rules = store.get_governance_rules(schema_id)
         assert len(rules) == 1
         print("✓ Stored and retrieved governance rules")
-        
+
         # Test list schemas
         schemas = store.list_schemas()
         assert len(schemas) == 1
@@ -200,6 +200,32 @@ def test_postgres_store():
         assert retrieved_schema == schema, "Schema mismatch"
         print("✓ Retrieved schema matches")
         
+        # Test bulk schema storage
+        bulk_ids = store.store_schemas_bulk([
+            ("test_order_bulk", schema, "1.0"),
+            ("test_order_bulk", schema, "2.0"),
+        ])
+        assert len(set(bulk_ids)) == 2
+        assert store.get_schema(bulk_ids[1], "2.0")["version"] == "2.0"
+        print("✓ Stored schemas in bulk")
+        
+        # Test bulk schema retrieval
+        bulk_schemas = store.get_schemas_bulk([bulk_ids[1], schema_id, "999999999"])
+        assert bulk_schemas[0]["version"] == "2.0"
+        assert bulk_schemas[1]["properties"] == schema["properties"]
+        assert bulk_schemas[2] is None
+        print("✓ Retrieved schemas in bulk")
+        
+        # Test transaction rollback
+        try:
+            with store.transaction():
+                store.store_metadata("test_order_tx", {"stage": "draft"}, "schema")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert store.get_metadata("test_order_tx", "schema") is None
+        print("✓ Rolled back transaction")
+        
         # Test ownership
         store.store_ownership(
             schema_id,
@@ -0,0 +1,91 @@
+"""
+Tests for PostgresMetadataStore internals that do not need a database.
+"""
+
+from unittest import mock
+
+import pytest
+
+from pycharter.metadata_store import postgres
+from pycharter.metadata_store.postgres import PostgresMetadataStore
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Store with an in-memory schema info cache and no connection."""
+    monkeypatch.delenv("PYCHARTER_SCHEMA_CACHE_DIR", raising=False)
+    monkeypatch.setattr(postgres, "_SCHEMA_INFO", {})
+    return PostgresMetadataStore(connection_string="postgresql://localhost/test")
+
+
+def _pool_with_connection(connection):
+    pool = mock.Mock(closed=False)
+    pool.getconn.return_value = connection
+    return pool
+
+
+class TestSchemaInfoRefresh:
+    """Tests for the background schema info refresh."""
+
+    def test_failed_refresh_keeps_stale_entry(self, store):
+        """Test that a query error does not overwrite the cached entry."""
+        postgres._write_schema_info(store._schema_info_key, {"initialized": True})
+        connection = mock.Mock()
+        connection.cursor.side_effect = RuntimeError("connection lost")
+        store._pool = _pool_with_connection(connection)
+
+        store._refresh_schema_info()
+
+        entry = postgres._read_schema_info(store._schema_info_key)
+        assert entry["info"] == {"initialized": True}
+        store._pool.putconn.assert_called_once_with(connection)
+
+    def test_refresh_uses_its_own_connection(self, store):
+        """Test that the refresh queries a pooled connection, not the store's."""
+        store._connection = mock.Mock()
+        connection = mock.MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (False,)
+        store._pool = _pool_with_connection(connection)
+
+        store._refresh_schema_info()
+
+        store._connection.cursor.assert_not_called()
+        entry = postgres._read_schema_info(store._schema_info_key)
+        assert entry["info"]["initialized"] is False
+        store._pool.putconn.assert_called_once_with(connection)
+
+
+class TestSharedPools:
+    """Tests for the shared connection pools."""
+
+    def test_pools_are_keyed_on_pool_size(self, monkeypatch):
+        """Test that a different pool_size gets its own pool with that maxconn."""
+        monkeypatch.setattr(postgres, "_POOLS", {})
+        pool_class = mock.Mock(side_effect=lambda *args, **kwargs: mock.Mock(closed=False))
+        monkeypatch.setattr(postgres, "ThreadedConnectionPool", pool_class)
+
+        small = postgres._get_pool("postgresql://localhost/test", 5)
+        assert postgres._get_pool("postgresql://localhost/test", 5) is small
+        large = postgres._get_pool("postgresql://localhost/test", 20)
+
+        assert large is not small
+        assert [c.args[1] for c in pool_class.call_args_list] == [5, 20]
+
+
+class TestGetSchemasBulk:
+    """Tests for get_schemas_bulk() without a database."""
+
+    def test_non_numeric_ids_map_to_none(self, store):
+        """Test that IDs that cannot exist are returned as None, not an error."""
+        store._connection = mock.MagicMock()
+        store._execute_prepared = mock.Mock()
+        cursor = store._connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            {"id": 1, "schema_data": {"type": "object"}, "version": "1.0.0"},
+        ]
+
+        result = store.get_schemas_bulk(["1", "not-an-id"])
+
+        assert result == [{"type": "object", "version": "1.0.0"}, None]
+        assert store._execute_prepared.call_args.args[3] == ([1],)
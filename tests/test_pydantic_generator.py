@@ -12,7 +12,9 @@ import pytest
 from pydantic import ValidationError
 
 from pycharter.pydantic_generator import (
+    clear_model_cache,
     from_dict,
+    from_dict_list,
     from_file,
     from_json,
     from_url,
@@ -236,6 +238,207 @@ class TestFromDict:
         with pytest.raises(ValidationError):
             Model(name="Al")  # Too short
 
+    def test_generated_model_is_cached(self):
+        """Test that converting the same schema twice reuses the model class."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"sku": {"type": "string"}},
+        }
+        Product1 = from_dict(schema, "Product")
+        Product2 = from_dict(dict(schema), "Product")
+        Other = from_dict(schema, "OtherProduct")
+
+        assert Product1 is Product2
+        assert Other is not Product1
+        assert Other.__name__ == "OtherProduct"
+
+        clear_model_cache()
+        assert from_dict(schema, "Product") is not Product1
+
+    def test_reregistered_validation_rebuilds_model(self, monkeypatch):
+        """Test that re-registering a validation invalidates cached models."""
+        from pycharter.shared import validations
+
+        def rejects(bad):
+            def _validate(value, info):
+                if value == bad:
+                    raise ValueError(f"{value} is not allowed")
+                return value
+            return lambda: _validate
+
+        monkeypatch.setattr(validations, "VALIDATION_REGISTRY", dict(validations.VALIDATION_REGISTRY))
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"x": {"type": "integer", "validations": {"custom": None}}},
+        }
+
+        validations.register_validation("custom", rejects(1))
+        with pytest.raises(ValidationError):
+            from_dict(schema, "Custom")(x=1)
+
+        validations.register_validation("custom", rejects(2))
+        Custom = from_dict(schema, "Custom")
+        assert Custom(x=1).x == 1
+        with pytest.raises(ValidationError):
+            Custom(x=2)
+
+    def test_reregistered_coercion_rebuilds_model(self, monkeypatch):
+        """Test that re-registering a coercion invalidates cached models."""
+        from pycharter.shared import coercions
+
+        monkeypatch.setattr(coercions, "COERCION_REGISTRY", dict(coercions.COERCION_REGISTRY))
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"code": {"type": "string", "coercion": "custom"}},
+        }
+
+        coercions.register_coercion("custom", str.upper)
+        assert from_dict(schema, "Code")(code="ab").code == "AB"
+
+        coercions.register_coercion("custom", str.lower)
+        assert from_dict(schema, "Code")(code="AB").code == "ab"
+
+    def test_model_cache_is_thread_safe(self, monkeypatch):
+        """Test that concurrent conversions with evictions do not fail."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pycharter.pydantic_generator import converter
+
+        monkeypatch.setattr(converter, "_MODEL_CACHE_MAXSIZE", 2)
+        schemas = [
+            {"type": "object", "version": "1.0.0", "properties": {f"f{i}": {"type": "string"}}}
+            for i in range(4)
+        ]
+
+        def convert(i):
+            return from_dict(schemas[i % 4], f"Model{i % 4}").__name__
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            names = list(pool.map(convert, range(400)))
+
+        assert names == [f"Model{i % 4}" for i in range(400)]
+        assert len(converter._MODEL_CACHE) <= 2
+
+    def test_generated_model_field_names(self):
+        """Test that generated models expose their field names as a tuple."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"sku": {"type": "string"}, "qty": {"type": "integer"}},
+        }
+        Item = from_dict(schema, "Item")
+
+        assert Item.__pycharter_field_names__ == ("sku", "qty")
+        assert Item(sku="a", qty=1).model_dump() == {"sku": "a", "qty": 1}
+
+    def test_file_model_is_cached_until_modified(self, tmp_path):
+        """Test that from_file reuses the model until the file changes."""
+        import os
+
+        path = tmp_path / "order.json"
+        path.write_text(json.dumps({
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"order_id": {"type": "string"}},
+        }))
+
+        Order1 = from_file(path, "Order")
+        assert from_file(path, "Order") is Order1
+
+        path.write_text(json.dumps({
+            "type": "object",
+            "version": "1.0.1",
+            "properties": {"order_id": {"type": "integer"}},
+        }))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        Order2 = from_file(path, "Order")
+        assert Order2 is not Order1
+        assert Order2(order_id=5).order_id == 5
+
+    def test_persistent_schema_cache(self, tmp_path, monkeypatch):
+        """Test that validated schemas are written to the persistent cache when enabled."""
+        from pycharter.shared.schema_cache import get_cached_schema, schema_hash
+
+        monkeypatch.setenv("PYCHARTER_SCHEMA_CACHE_DIR", str(tmp_path))
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"warehouse_code": {"type": "string"}},
+        }
+        from_dict(schema, "Warehouse")
+
+        cached = get_cached_schema(schema_hash(schema))
+        assert cached is not None
+        assert json.loads(cached) == schema
+        assert (tmp_path / "schemas.sqlite3").exists()
+
+    def test_persistent_schema_cache_skips_unvalidated_schemas(self, tmp_path, monkeypatch):
+        """Test that schemas written by to_file() are not recorded as validated."""
+        from pydantic import BaseModel
+
+        from pycharter import to_dict, to_file
+        from pycharter.shared.schema_cache import get_cached_schema, schema_hash
+
+        class Shipment(BaseModel):
+            shipment_id: str
+
+        monkeypatch.setenv("PYCHARTER_SCHEMA_CACHE_DIR", str(tmp_path))
+        to_file(Shipment, tmp_path / "shipment.json", version="1.0.0")
+
+        assert get_cached_schema(schema_hash(to_dict(Shipment, version="1.0.0"))) is None
+
+    def test_schema_hash_depends_on_pycharter_version(self, monkeypatch):
+        """Test that cache keys from another release do not match."""
+        import hashlib
+
+        from pycharter.shared import schema_cache
+
+        schema = {"type": "object", "version": "1.0.0"}
+        key = schema_cache.schema_hash(schema)
+        monkeypatch.setattr(
+            schema_cache, "_HASH_PERSON", hashlib.blake2b(b"pycharter-0.0.0", digest_size=16).digest()
+        )
+        assert schema_cache.schema_hash(schema) != key
+
+
+class TestFromDictList:
+    """Tests for from_dict_list function."""
+
+    def test_validate_rows(self):
+        """Test validating a list of rows against a schema."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {
+                "name": {"type": "string"},
+                "value": {"type": "number", "minimum": 0},
+            },
+            "required": ["name", "value"],
+        }
+        rows = [{"name": f"item-{i}", "value": i} for i in range(100)]
+        items = from_dict_list(schema, "Item", rows)
+
+        assert len(items) == 100
+        assert items[5].name == "item-5"
+        assert items[5].value == 5.0
+        assert isinstance(items[0], from_dict(schema, "Item"))
+
+    def test_invalid_row_raises(self):
+        """Test that an invalid row raises a ValidationError."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"value": {"type": "number", "minimum": 0}},
+            "required": ["value"],
+        }
+        with pytest.raises(ValidationError):
+            from_dict_list(schema, "Item", [{"value": 1}, {"value": -1}])
+
 
 class TestFromJson:
     """Tests for from_json function."""
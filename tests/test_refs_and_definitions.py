@@ -199,6 +199,35 @@ class TestRefsAndDefinitions:
         assert instance.customer1.name == "Default"
         assert instance.customer2.name == "Bob"
 
+    def test_self_referencing_definition(self):
+        """Test that a recursive $ref resolves without infinite recursion."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {
+                "category": {"$ref": "#/$defs/Category"},
+                "secondary_category": {"$ref": "#/$defs/Category"}
+            },
+            "$defs": {
+                "Category": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "parent": {"$ref": "#/$defs/Category"}
+                    }
+                }
+            }
+        }
+        
+        Model = from_dict(schema, "TestModel")
+        instance = Model(
+            category={"name": "Laptops", "parent": {"name": "Electronics"}},
+            secondary_category={"name": "Sale"}
+        )
+        assert instance.category.name == "Laptops"
+        assert instance.category.parent is not None
+        assert instance.secondary_category.name == "Sale"
+
 
 class TestFormatField:
     """Test format field support."""
@@ -11,6 +11,7 @@ from pydantic import ValidationError
 from pycharter import (
     get_model_from_contract,
     get_model_from_store,
+    try_validate,
     validate,
     validate_batch,
     validate_batch_with_contract,
@@ -141,6 +142,29 @@ class TestValidate:
         assert isinstance(result.data.age, int)
 
 
+class TestTryValidate:
+    """Tests for try_validate function."""
+
+    def test_try_validate(self):
+        """Test non-raising validation returns instances or error dicts."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"age": {"type": "integer", "minimum": 0}},
+        }
+        Person = from_dict(schema, "Person")
+
+        ok, person = try_validate(Person, {"age": 30})
+        assert ok is True
+        assert person.age == 30
+
+        ok, errors = try_validate(Person, {"age": -1})
+        assert ok is False
+        assert errors[0]["loc"] == ("age",)
+        assert "url" not in errors[0]
+        assert "ctx" not in errors[0]
+
+
 class TestValidateBatch:
     """Tests for validate_batch function."""
 
@@ -190,6 +214,20 @@ class TestValidateBatch:
         assert results[0].is_valid is True
         assert results[1].is_valid is False
         assert results[2].is_valid is True
+        assert results[1].errors == validate(Person, {"age": -5}).errors
+        assert results[2].data.age == 30
+
+    def test_validate_batch_strict_raises(self):
+        """Test that strict batch validation raises on the first invalid item."""
+        schema = {
+            "type": "object",
+            "version": "1.0.0",
+            "properties": {"age": {"type": "integer"}},
+        }
+        Person = from_dict(schema, "Person")
+
+        with pytest.raises(ValidationError):
+            validate_batch(Person, [{"age": 1}, {"age": "old"}], strict=True)
 
     def test_validate_batch_empty_list(self):
         """Test batch validation with empty list."""
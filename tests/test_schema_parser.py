@@ -2,10 +2,14 @@
 Tests for the schema parser module.
 """
 
+import json
+import sys
+
 import pytest
 
 from pycharter.shared.schema_parser import (
     get_schema_type,
+    intern_schema_strings,
     is_required,
     normalize_schema,
     validate_schema,
@@ -61,3 +65,17 @@ def test_is_required():
     assert is_required("age", schema) is False
     assert is_required("email", schema) is False
 
+
+def test_intern_schema_strings():
+    """Test that common keywords are interned without changing the schema."""
+    schema = json.loads(
+        '{"type": "object", "properties": {"tags": {"type": "array", '
+        '"items": {"type": "string"}}}, "required": ["tags"]}'
+    )
+    interned = intern_schema_strings(schema)
+    
+    assert interned == schema
+    assert interned is not schema
+    keys = list(interned["properties"]["tags"]["items"])
+    assert keys[0] is sys.intern("type")
+    assert interned["properties"]["tags"]["items"]["type"] is sys.intern("string")